@@ -11,6 +11,25 @@ from .commands import (
 from engine.exchange import Exchange
 from engine.trader import Trader
 
+try:
+    import readline  # line editing and history for input(); absent on Windows
+except ImportError:
+    readline = None
+
+PROMPT = ">>> "
+
+HELP_MENU = """
+    login      — Authenticate using your Trader ID
+    help       — Display this menu
+    next       — Refresh market data
+    match      — Execute order matching
+    portfolio  — View your portfolio holdings and P&L
+    status     — Show pending orders
+    buy        — Place a buy order
+    sell       — Place a sell order
+    quit       — Exit the terminal
+    """
+
 
 class CLI:
     """
@@ -20,18 +39,16 @@ class CLI:
 
     Attributes:
         exchange (Exchange): the market exchange instance.
-        trader (Trader): the trader instance.
+        active_trader (Optional[Trader]): the logged-in trader, None until login.
         logger (logging.Logger): logger for audit logs.
         commands (dict[str, Callable[[Optional[List[str]]], None]]): mapping of command names to handler callables.
 
     Examples:
-        >>> from logging_config import setup_logger
+        >>> import logging
         >>> exchange = Exchange(market_data={})
-        >>> trader = Trader(trader_id=1, starting_balance=100000)
-        >>> logger = setup_logger()
-        >>> cli = CLI(exchange, trader, logger)
+        >>> cli = CLI(exchange, logging.getLogger("cli-doctest"))
         >>> list(cli.commands)
-        ['next', 'buy', 'sell', 'match', 'status']
+        ['login', 'next', 'buy', 'sell', 'match', 'status', 'portfolio', 'help']
     """
 
     def __init__(
@@ -44,15 +61,12 @@ class CLI:
 
         Args:
             exchange (Exchange): the market exchange instance for price and order operations.
-            trader (Trader): the trader instance representing the user.
             logger (logging.Logger): logger used to record command execution.
 
         Examples:
-        >>> from logging_config import setup_logger
+        >>> import logging
         >>> exchange = Exchange(market_data={})
-        >>> trader = Trader(trader_id=1, starting_balance=100000)
-        >>> logger = setup_logger()
-        >>> cli = CLI(exchange, trader, logger)
+        >>> cli = CLI(exchange, logging.getLogger("cli-doctest"))
         >>> isinstance(cli, CLI)
         True
         """
@@ -60,68 +74,56 @@ class CLI:
         self.active_trader: Trader | None = None
         self.logger = logger
 
-        HELP_MENU = """
-    login      — Authenticate using your Trader ID
-    help       — Display this menu
-    next       — Refresh market data
-    match      — Execute order matching
-    portfolio  — View your portfolio holdings and P&L
-    status     — Show pending orders
-    buy        — Place a buy order
-    sell       — Place a sell order
-    quit       — Exit the terminal
-    """
-
-        # map command strings to handler callables
+        # map command strings to bound handler methods
         self.commands: dict[str, Callable[[Optional[List[str]]], None]] = {
-            "login": lambda args=[]: self.do_login(args),
-            "next": lambda args=None: do_next(self.exchange),
-            "buy": lambda args=[]: do_place_order(
-                self.exchange, self.active_trader, "buy", args
-            ),
-            "sell": lambda args=[]: do_place_order(
-                self.exchange, self.active_trader, "sell", args
-            ),
-            "match": lambda args=[]: do_match(self.exchange, args),
-            "status": lambda args=None: do_status(self.exchange),
-            "portfolio": lambda args=None: do_portfolio(
-                self.exchange, self.active_trader
-            ),
-            "help": lambda args=None: print(HELP_MENU),
+            "login": self.do_login,
+            "next": self._cmd_next,
+            "buy": self._cmd_buy,
+            "sell": self._cmd_sell,
+            "match": self._cmd_match,
+            "status": self._cmd_status,
+            "portfolio": self._cmd_portfolio,
+            "help": self._cmd_help,
         }
+        # tab-completion candidates, fixed once the command map is built
+        self._completions = (*self.commands, "quit")
 
     def run(self):
         """
         Start the interactive loop, reading user input and dispatching commands.
 
-        Continuously prompts with '>>> '.
+        Continuously prompts with '>>> ', with history and tab-completion of
+        command names when readline is available.
         Handles empty input by printing a blank line, EOF by exiting gracefully,
         and 'quit' to terminate.
 
         Examples:
+        >>> import logging
         >>> from cli.cli import CLI
         >>> from engine.exchange import Exchange
-        >>> from engine.trader import Trader
-        >>> from logging_config import setup_logger
-        >>> logger = setup_logger()
         >>> exchange = Exchange(market_data={})
-        >>> trader = Trader(trader_id=1, starting_balance=1000)
-        >>> cli = CLI(exchange, trader, logger)
+        >>> cli = CLI(exchange, logging.getLogger("cli-doctest"))
         >>> # This would start an interactive loop
         >>> cli.run()  # doctest: +SKIP
         """
+        if readline is not None:
+            readline.set_completer(self._complete)
+            readline.parse_and_bind("tab: complete")
+
         while True:
             try:
-                raw = input(">>> ")
+                raw = input(PROMPT)
             except EOFError:
                 log_quit()
                 break
 
-            if not raw.strip():
+            # one tokenizing pass; an empty token list means a blank line
+            tokens = raw.split()
+            if not tokens:
                 print()  # blank line on empty enter
                 continue
 
-            cmd, *args = raw.split()
+            cmd, *args = tokens
             if cmd == "quit":
                 log_quit()
                 break
@@ -133,8 +135,34 @@ class CLI:
             else:
                 print("Unknown command. Please try again.")
 
+    def _complete(self, text: str, state: int) -> Optional[str]:
+        """readline completer: return the state-th command name starting with text."""
+        matches = [cmd for cmd in self._completions if cmd.startswith(text)]
+        return matches[state] if state < len(matches) else None
+
+    def _cmd_next(self, args: Optional[List[str]] = None) -> None:
+        do_next(self.exchange)
+
+    def _cmd_buy(self, args: Optional[List[str]] = None) -> None:
+        do_place_order(self.exchange, self.active_trader, "buy", args)
+
+    def _cmd_sell(self, args: Optional[List[str]] = None) -> None:
+        do_place_order(self.exchange, self.active_trader, "sell", args)
+
+    def _cmd_match(self, args: Optional[List[str]] = None) -> None:
+        do_match(self.exchange, args)
+
+    def _cmd_status(self, args: Optional[List[str]] = None) -> None:
+        do_status(self.exchange)
+
+    def _cmd_portfolio(self, args: Optional[List[str]] = None) -> None:
+        do_portfolio(self.exchange, self.active_trader)
+
+    def _cmd_help(self, args: Optional[List[str]] = None) -> None:
+        print(HELP_MENU)
+
     def do_login(self, args):
-        if args is None or len(args) != 1 or args[0].isnumeric() == False:
+        if args is None or len(args) != 1 or not args[0].isnumeric():
             print("\nUsage: login <trader_id>\n")
             self.logger.warning(
                 "%s command usage error: args=%r — %s",
@@ -1,21 +1,28 @@
-from cli.validation import parse_order, validate_symbol
+from cli.validation import ORDER_ERRORS, parse_order, resolve_symbol, validate_symbol
 from view.render import display_prices, display_portfolio, display_pending_orders
 from engine.exchange import Exchange
+from engine.order import Order
 from engine.trader import Trader
+import functools
 import logging
-from logging_config import LOG_NAME
+from logging_config import LOG_NAME, stop_logger
 
 from typing import List, Callable, Optional
 
 logger = logging.getLogger(LOG_NAME)
 
 
-def handle_order(exchange: Exchange, trader: Trader, order_type: str, args: list[str]):
+def handle_order(
+    exchange: Exchange, trader: Trader, order_type: str, args: list[str]
+) -> Optional[Order]:
     """
     Handle a buy or sell order: parse args, validate and enqueue the order, then show portfolio.
 
     Prints usage errors or order confirmation followed by the updated portfolio.
 
+    Returns:
+        The enqueued Order, or None if the command was rejected.
+
     Examples:
         >>> from engine.exchange import Exchange
         >>> from engine.trader import Trader
@@ -37,26 +44,38 @@ def handle_order(exchange: Exchange, trader: Trader, order_type: str, args: list
         )
         return
 
-    symbol, quantity, price = parse_order(args)
+    err, parsed = parse_order(args)
 
-    if not quantity or not price or not symbol:
+    if err:
         print(f"\nUsage: {order_type.lower()} <SYMBOL> <QTY> <PRICE>\n")
         logger.warning(
             "%s command usage error: args=%r — %s",
             order_type.upper(),
             args,
-            "bad quantity or price",
+            ORDER_ERRORS[err],
         )
         return
 
-    if validate_symbol(symbol, exchange, order_type.upper(), args) == False:
+    symbol = parsed.symbol
+    symbol_id = resolve_symbol(symbol, exchange, order_type.upper(), args)
+
+    if symbol_id is None:
         return
 
+    # Use the exchange's own key object so the portfolio and market data
+    # lookups downstream hit the identity fast path in dict probes.
+    symbol = exchange.symbols[symbol_id]
+
     o = trader.place_order(
-        symbol=symbol, order_type=order_type, quantity=quantity, price=price
+        symbol=symbol,
+        order_type=order_type,
+        quantity=parsed.quantity,
+        price=parsed.price,
+        symbol_id=symbol_id,
     )
     exchange.add_order(o)
     print(f"\nOrder placed for {symbol}.\n")
+    return o
 
 
 def log_command(fn):
@@ -71,8 +90,14 @@ def log_command(fn):
         3
     """
 
+    cmd = fn.__name__.replace("do_", "").upper()
+
+    @functools.wraps(fn)
     def wrapper(*args, **kwargs):
-        cmd = fn.__name__.replace("do_", "").upper()
+        # The level is checked per call rather than at decoration time, since
+        # setup_logger() runs after this module is imported.
+        if not logger.isEnabledFor(logging.INFO):
+            return fn(*args, **kwargs)
 
         logger.info("%s command received: args=%r", cmd, args or kwargs)
         result = fn(*args, **kwargs)
@@ -91,10 +116,9 @@ def do_next(exchange: Exchange):
         >>> from engine.exchange import Exchange
         >>> from engine.trader import Trader
         >>> from engine.stock import Stock
-        >>> ex = Exchange({'AAPL': Stock('AAPL', 100.0)})
-        >>> tr = Trader(1, 1000.0)
-        >>> do_next(ex, tr) is None
-        True
+        >>> ex = Exchange({'AAPL': Stock('AAPL', 100.0, tick_model=lambda s: 101.0)})
+        >>> do_next(ex)  # doctest: +NORMALIZE_WHITESPACE
+        AAPL  | $101.00
     """
     exchange.process_tick()
     print()
@@ -115,22 +139,20 @@ def do_place_order(
         >>> from engine.stock import Stock
         >>> ex = Exchange({'AAPL': Stock('AAPL', 100.0)})
         >>> tr = Trader(1, 1000.0)
-        >>> do_place_order(ex, tr, 'sell', ['AAPL', '1', '100']) is None
-        True
+        >>> do_place_order(ex, tr, 'buy', ['AAPL', '1', '100'])  # doctest: +NORMALIZE_WHITESPACE
+        Order placed for AAPL.
     """
 
-    symbol, qty, price = parse_order(args)
+    o = handle_order(exchange, trader, order_type, args)
 
-    handle_order(exchange, trader, order_type, args)
-
-    # only log if parsing succeeded
-    if None not in (symbol, qty, price):
+    # only log if the order was actually queued
+    if o is not None:
         logger.info(
             "%s order queued: symbol=%s, qty=%d, price=%.2f",
             order_type.upper(),
-            symbol,
-            qty,
-            price,
+            o.symbol,
+            o.quantity,
+            o.limit_price,
         )
 
 
@@ -143,7 +165,7 @@ def do_match(exchange: Exchange, args: List[str]):
         >>> from engine.exchange import Exchange
         >>> from engine.stock import Stock
         >>> ex = Exchange({'AAPL': Stock('AAPL', 100.0)})
-        >>> do_match(ex, ['AAPL'])
+        >>> do_match(ex, ['AAPL'])  # doctest: +NORMALIZE_WHITESPACE
         No trades yet
     """
     if not args or len(args) != 1:
@@ -158,7 +180,7 @@ def do_match(exchange: Exchange, args: List[str]):
 
     symbol = args[0]
 
-    if validate_symbol(symbol, exchange, "MATCH", args) == False:
+    if not validate_symbol(symbol, exchange, "MATCH", args):
         return
 
     trades = exchange.match_orders(symbol)
@@ -166,14 +188,16 @@ def do_match(exchange: Exchange, args: List[str]):
     if not trades:
         print("\nNo trades yet\n")
     else:
+        log_trades = logger.isEnabledFor(logging.INFO)
         for t in trades:
             print(f"\nTRADE: {t.quantity}×{t.symbol} @ ${t.price:.2f}")
-            logger.info(
-                "MATCH command status: trade symbol=%s processed @ qty=%d, price=%.2f",
-                symbol,
-                t.quantity,
-                t.price,
-            )
+            if log_trades:
+                logger.info(
+                    "MATCH command status: trade symbol=%s processed @ qty=%d, price=%.2f",
+                    symbol,
+                    t.quantity,
+                    t.price,
+                )
         print()
 
 
@@ -195,23 +219,16 @@ def do_portfolio(exchange: Exchange, trader: Trader):
 @log_command
 def do_status(exchange: Exchange):
     """
-    Display pending orders and the trader's portfolio.
+    Display pending orders on the exchange.
 
     Examples:
         >>> from engine.exchange import Exchange
-        >>> from engine.trader import Trader
         >>> from engine.stock import Stock
         >>> ex = Exchange({'AAPL': Stock('AAPL', 100.0)})
-        >>> tr = Trader(1, 1000.0)
-        >>> do_status(ex, tr) # doctest: +NORMALIZE_WHITESPACE
+        >>> do_status(ex) # doctest: +NORMALIZE_WHITESPACE
         Currently there are no pending orders on the exchange.
-        Cash balance: $1000.0
-        Holdings: {}
     """
-    pending = sum(
-        len(book._buy_heap) + len(book._sell_heap)
-        for book in exchange.order_books.values()
-    )
+    pending = exchange.pending_count
     if pending > 0:
         display_pending_orders(exchange)
     else:
@@ -222,7 +239,7 @@ def do_status(exchange: Exchange):
 
 def log_quit():
     """
-    Print goodbye and log shutdown.
+    Print goodbye, log shutdown and flush the log file.
 
     Examples:
         >>> log_quit() # doctest: +NORMALIZE_WHITESPACE
@@ -230,3 +247,4 @@ def log_quit():
     """
     print("\nThank you for using York Stock Exchange.")
     logger.info("York Stock Exchange CLI shutting down")
+    stop_logger()
@@ -1,40 +1,122 @@
 from engine.exchange import Exchange
+from engine.order import to_ticks
 from engine.trader import Trader
 
-from typing import List, Tuple
+from typing import List, NamedTuple, Optional, Tuple
 import logging
+import math
+import re
 from logging_config import LOG_NAME
 
 logger = logging.getLogger(LOG_NAME)
 
+# Shape checks run before int()/float(), so mistyped input is rejected by a
+# failed match instead of a raised and caught ValueError.
+_is_int = re.compile(r"[+-]?\d+").fullmatch
+_is_decimal = re.compile(r"[+-]?(?:\d+\.?\d*|\.\d+)").fullmatch
 
-def parse_order(args: List[str]) -> Tuple[str, int, float]:
+# parse_order error bits; a failed parse may set more than one.
+ORDER_BAD_ARGS = 1
+ORDER_BAD_QTY = 2
+ORDER_BAD_PRICE = 4
+
+ORDER_ERRORS = {
+    ORDER_BAD_ARGS: "wrong number of arguments",
+    ORDER_BAD_QTY: "bad quantity",
+    ORDER_BAD_PRICE: "bad price",
+    ORDER_BAD_QTY | ORDER_BAD_PRICE: "bad quantity and price",
+}
+
+
+class ParsedOrder(NamedTuple):
+    """A buy/sell command's arguments, typed and checked."""
+
+    symbol: str
+    quantity: int
+    price: float
+
+
+def parse_order(args: List[str]) -> Tuple[int, Optional[ParsedOrder]]:
     """
-    Parse a list of CLI args into (symbol, qty, price).
+    Parse a list of CLI args into a ParsedOrder in a single pass.
+
+    Quantity and price are both checked before returning, so the error code
+    reports every bad field at once. Zero or negative values are rejected here
+    rather than being mistaken for missing ones later. Quantity must be a
+    whole number and price a plain decimal (no exponent, inf or nan) of at
+    least one tick (TICK_SIZE) once rounded.
 
     Args:
         args (List[str]): [symbol, qty, price] as strings.
 
     Returns:
-        A tuple (symbol, quantity, price), where quantity and price
-        are typed, or (symbol, None, None) if parsing fails.
+        A tuple (err, parsed): err is 0 and parsed the typed order on success,
+        otherwise err is a mask of ORDER_BAD_* bits (see ORDER_ERRORS) and
+        parsed is None.
 
     Examples:
         >>> parse_order(["AAPL","10","150"])
-        ('AAPL', 10, 150.0)
+        (0, ParsedOrder(symbol='AAPL', quantity=10, price=150.0))
         >>> parse_order(["AAPL","foo","150"])
-        ('AAPL', None, None)
+        (2, None)
+        >>> parse_order(["AAPL","0","-1"])
+        (6, None)
+        >>> parse_order(["AAPL","1","0.004"])
+        (4, None)
     """
 
     if args is None or len(args) != 3:
-        return None, None, None
+        return ORDER_BAD_ARGS, None
 
     symbol, quantity, price = args
+    err = 0
+
+    qty = int(quantity) if _is_int(quantity) else 0
+    if qty <= 0:
+        err |= ORDER_BAD_QTY
+
+    px = float(price) if _is_decimal(price) else 0.0
+    if not (px > 0 and math.isfinite(px) and to_ticks(px) > 0):
+        err |= ORDER_BAD_PRICE
 
-    try:
-        return symbol, int(quantity), float(price)
-    except ValueError:
-        return symbol, None, None
+    if err:
+        return err, None
+    return 0, ParsedOrder(symbol, qty, px)
+
+
+def resolve_symbol(
+    symbol: str, exchange: Exchange, cmd: str, args: List[str]
+) -> Optional[int]:
+    """
+    Look SYMBOL up in the exchange once and return its symbol_id.
+
+    Prints the list of valid symbols and logs a warning if it is unknown.
+
+    Args:
+        symbol (str): ticker to resolve
+        exchange (Exchange): the Exchange instance
+        cmd (str): the CLI command name (e.g. "BUY")
+        args (List[str]): raw argv list
+
+    Returns:
+        The symbol's Exchange.symbol_ids entry, or None (after printing usage)
+        if it is not listed.
+
+    Examples:
+        >>> from engine.exchange import Exchange
+        >>> from engine.stock import Stock
+        >>> ex = Exchange(market_data={"AAPL": Stock("AAPL", 1.0)})
+        >>> resolve_symbol("AAPL", ex, "BUY", ["AAPL","1","1"])
+        0
+    """
+    symbol_id = exchange.symbol_ids.get(symbol)
+
+    if symbol_id is None:
+        print(f"Unknown symbol. Please enter one of: {exchange.symbols_display}")
+
+        logger.warning("%s command usage error: args=%r — unknown symbol", cmd, args)
+
+    return symbol_id
 
 
 def validate_symbol(symbol: str, exchange: Exchange, cmd: str, args: List[str]) -> bool:
@@ -59,12 +141,4 @@ def validate_symbol(symbol: str, exchange: Exchange, cmd: str, args: List[str])
         >>> validate_symbol("FOO", ex, "BUY", ["FOO","1","1"])  # doctest: +SKIP
         False
     """
-    if symbol not in exchange.market_data:
-        valid = ", ".join(sorted(exchange.market_data.keys()))
-
-        print(f"Unknown symbol. Please enter one of: {valid}")
-
-        logger.warning("%s command usage error: args=%r — unknown symbol", cmd, args)
-        return False
-    else:
-        return True
+    return resolve_symbol(symbol, exchange, cmd, args) is not None
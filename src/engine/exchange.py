@@ -1,7 +1,8 @@
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Tuple
+import time
 
-from .order_book import OrderBook
+from .order_book import OrderBook, RestingCount
 from .stock import Stock
 from .order import Order
 from .trade import Trade
@@ -19,7 +20,12 @@ class Exchange:
     Attributes:
         market_data (Dict[str, Stock]): Current market price and history for each symbol.
         order_books (Dict[str, OrderBook]): Order book per symbol for managing open orders.
-        current_time (datetime): Timestamp of the last processed tick.
+        symbols (Tuple[str, ...]): Listed symbols; a symbol's position is its symbol_id.
+        symbol_ids (Dict[str, int]): symbol_id of each listed symbol.
+        symbols_display (str): Listed symbols, sorted and comma-separated, for messages.
+        current_time_ns (int): Time of the last processed tick, in epoch nanoseconds.
+        current_time (datetime): current_time_ns as a datetime, built on access.
+        pending_count (int): Orders resting across all books.
 
     Examples:
         >>> from engine.trader import Trader
@@ -44,17 +50,37 @@ class Exchange:
         """
         self.traders: Dict[int, Trader] = {}
         self.market_data = market_data
-        self.order_books: Dict[str, OrderBook] = {
-            symbol: OrderBook() for symbol in market_data.keys()
+        # The symbol set is fixed at startup, so books live in a list indexed
+        # by symbol_id; order_books is a by-name view of the same books.
+        self.symbols: Tuple[str, ...] = tuple(market_data)
+        self.symbol_ids: Dict[str, int] = {
+            symbol: idx for idx, symbol in enumerate(self.symbols)
         }
-        self.current_time = datetime.now()
+        # Every book updates the same count, so pending_count is one read.
+        self._resting = RestingCount()
+        self._books: List[OrderBook] = [OrderBook(self._resting) for _ in self.symbols]
+        self.symbols_display = ", ".join(sorted(self.symbols))
+        # Each stock may carry its own tick model, so ticks stay per stock; the
+        # bound methods are taken once so a tick is a plain call per symbol.
+        self._tickers = tuple(stock.tick for stock in market_data.values())
+        self.order_books: Dict[str, OrderBook] = dict(zip(self.symbols, self._books))
+        self.current_time_ns = time.time_ns()
 
     def add_order(self, order: Order) -> None:
         """Enqueue an Order in its respective order book for later matching.
 
+        Within a book, orders are ranked by price, then created_at, then arrival:
+        the order joins the back of its price level unless it is back-dated.
+        The order's book is found by its symbol_id, resolved from the symbol
+        only if the caller has not already set it.
+
         Args:
             order (Order): The order to add to the order book.
 
+        Raises:
+            ValueError: if the caller set a symbol_id that is not the id of the
+                order's symbol.
+
         Examples:
             >>> data = {sym: Stock(sym, 100.0) for sym in ("AAPL", "MSFT")}
             >>> exchange = Exchange(market_data=data)
@@ -63,7 +89,46 @@ class Exchange:
             >>> exchange.order_books["AAPL"].buy_size()
             1
         """
-        self.order_books[order.symbol].add_order(order)
+        symbols = self.symbols
+        symbol_id = order.symbol_id
+        if symbol_id is None:
+            symbol_id = order.symbol_id = self.symbol_ids[order.symbol]
+        elif not 0 <= symbol_id < len(symbols) or symbols[symbol_id] != order.symbol:
+            raise ValueError(
+                f"Order {order.order_id} has symbol_id {symbol_id}, "
+                f"which is not the id of {order.symbol}"
+            )
+
+        self._books[symbol_id].add_order(order)
+
+    @property
+    def current_time(self) -> datetime:
+        """Return the time of the last processed tick as a datetime.
+
+        Examples:
+            >>> exchange = Exchange(market_data={})
+            >>> isinstance(exchange.current_time, datetime)
+            True
+        """
+        return datetime.fromtimestamp(self.current_time_ns / 1e9)
+
+    @property
+    def pending_count(self) -> int:
+        """Return the number of orders resting across all order books.
+
+        The books share one RestingCount and update it themselves, so this is
+        O(1) and stays correct however a book is changed (adds, fills, pops or
+        cancels).
+
+        Examples:
+            >>> data = {sym: Stock(sym, 100.0) for sym in ("AAPL", "MSFT")}
+            >>> exchange = Exchange(market_data=data)
+            >>> exchange.add_order(Order(1, "AAPL", "buy", 1, 10.0))
+            >>> exchange.add_order(Order(1, "MSFT", "sell", 1, 20.0))
+            >>> exchange.pending_count
+            2
+        """
+        return self._resting.value
 
     def register_trader(self, trader: Trader) -> None:
         """Register trader in a stock exchange"""
@@ -86,11 +151,10 @@ class Exchange:
         >>> any(b != a for b, a in zip(before, after))
         True
         """
-        self.current_time = datetime.now()
+        self.current_time_ns = time.time_ns()
 
-        for stock in self.market_data.values():
-            nxt = stock.simulate_price_tick()
-            stock.update_price(nxt)
+        for tick in self._tickers:
+            tick()
 
     def match_orders(self, symbol: str) -> List[Trade]:
         """Match buy and sell orders in the specified symbol's order book.
@@ -109,26 +173,28 @@ class Exchange:
             >>> exchange.match_orders("AAPL")
             []
         """
+        return self._match_book(symbol, self.order_books[symbol])
 
-        order_book = self.order_books.get(symbol)
+    def _match_book(self, symbol: str, order_book: OrderBook) -> List[Trade]:
+        """Cross `order_book` until its best bid is below its best ask."""
         trades: List[Trade] = []
 
-        while True:
-            best_buy, best_sell = (
-                order_book.peek_best_buy(),
-                order_book.peek_best_sell(),
-            )
-
-            if not best_buy or not best_sell:
-                break
+        # Bind hot lookups once; the loop body runs once per fill.
+        peek_best_buy = order_book.peek_best_buy
+        peek_best_sell = order_book.peek_best_sell
+        fill = order_book.fill
+        traders = self.traders
+        record = trades.append
 
-            if best_buy.limit_price < best_sell.limit_price:
-                break
+        # Empty sides are infinite sentinels, so one compare covers them too.
+        while order_book.best_bid_ticks >= order_book.best_ask_ticks:
+            best_buy = peek_best_buy()
+            best_sell = peek_best_sell()
 
+            exec_price = best_sell.limit_price
             orig_buy_qty = best_buy.quantity
             orig_sell_qty = best_sell.quantity
-            exec_qty = min(orig_buy_qty, orig_sell_qty)
-            exec_price = best_sell.limit_price
+            exec_qty = orig_buy_qty if orig_buy_qty < orig_sell_qty else orig_sell_qty
 
             new_trade = Trade(
                 best_buy,
@@ -140,21 +206,66 @@ class Exchange:
                 orig_sell_qty,
             )
 
-            best_buy.quantity -= exec_qty
-            best_sell.quantity -= exec_qty
+            fill(best_buy, exec_qty)
+            fill(best_sell, exec_qty)
 
-            if best_buy.quantity == 0:
-                order_book.pop_best_buy()
+            traders[new_trade.seller_id].fill_sell(new_trade)
+            traders[new_trade.buyer_id].fill_buy(new_trade)
 
-            if best_sell.quantity == 0:
-                order_book.pop_best_sell()
+            record(new_trade)
 
-            seller_id, buyer_id = best_sell.trader_id, best_buy.trader_id
+        order_book.dirty = False
+        return trades
 
-            seller, buyer = self.traders[seller_id], self.traders[buyer_id]
+    def match_all(self) -> List[Trade]:
+        """Match every order book that received orders since it was last matched.
 
-            seller.update_portfolio(new_trade), buyer.update_portfolio(new_trade)
+        A book that has been matched is uncrossed until a new order arrives, so
+        clean books are skipped without being inspected.
+
+        Returns:
+            List[Trade]: Trades executed across all symbols, grouped by symbol.
+
+        Examples:
+            >>> data = {sym: Stock(sym, 100.0) for sym in ("AAPL", "MSFT")}
+            >>> exchange = Exchange(market_data=data)
+            >>> exchange.match_all()
+            []
+        """
+        trades: List[Trade] = []
+        match_book = self._match_book
+
+        for symbol, order_book in zip(self.symbols, self._books):
+            if order_book.dirty:
+                trades.extend(match_book(symbol, order_book))
+
+        return trades
+
+    def tick_and_match(self) -> List[Trade]:
+        """Advance every price by one tick and match every dirty book, in one pass.
+
+        Equivalent to process_tick() followed by match_all(), visiting each
+        symbol once instead of once per call. Matching depends only on limit
+        prices, so interleaving the two does not change the trades.
+
+        Returns:
+            List[Trade]: Trades executed across all symbols, grouped by symbol.
+
+        Examples:
+            >>> data = {sym: Stock(sym, 100.0) for sym in ("AAPL", "MSFT")}
+            >>> exchange = Exchange(market_data=data)
+            >>> exchange.tick_and_match()
+            []
+            >>> len(exchange.market_data["AAPL"].history)
+            2
+        """
+        self.current_time_ns = time.time_ns()
+        trades: List[Trade] = []
+        match_book = self._match_book
 
-            trades.append(new_trade)
+        for tick, symbol, order_book in zip(self._tickers, self.symbols, self._books):
+            tick()
+            if order_book.dirty:
+                trades.extend(match_book(symbol, order_book))
 
         return trades
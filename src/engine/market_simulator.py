@@ -1,5 +1,6 @@
 from typing import Callable, Optional
 from datetime import timedelta
+import sys
 
 from .exchange import Exchange
 from .trade import Trade
@@ -25,20 +26,17 @@ class MarketSimulator:
         self.exchange = exchange
         self.tick_interval = tick_interval
         self._running = False
+        # step() runs in a tight loop; resolve the exchange method once.
+        self._tick_and_match = exchange.tick_and_match
 
     def step(self) -> list[Trade]:
         """
         Advance prices by one tick, then match all symbols.
         Returns the list of Trades executed this step.
         """
-        # 1) advance every stock by one tick
-        self.exchange.process_tick()
-        # 2) match on every book, collect trades
-        symbols = self.exchange.order_books.keys()
-
-        for symbol in symbols:
-            self.exchange.match_orders(symbol)
-        return
+        # advance every stock by one tick and match every book with new
+        # orders, in a single sweep over the symbols
+        return self._tick_and_match()
 
     def run(self, steps: Optional[int] = None) -> None:
         """
@@ -46,17 +44,21 @@ class MarketSimulator:
         """
         self._running = True
         count = 0
+        write = sys.stdout.write
 
         while self._running and (steps is None or count < steps):
             trades = self.step()
+            count += 1
 
             if not trades:
                 continue
 
-            for t in trades:
-                print(f"\nTRADE: {t.quantity}x{t.symbol} @ ${t.price:.2f}")
-            print()
-            count += 1
+            # One write per step rather than one per trade.
+            lines = [
+                f"\nTRADE: {t.quantity}x{t.symbol} @ ${t.price:.2f}\n" for t in trades
+            ]
+            lines.append("\n")
+            write("".join(lines))
 
     def stop(self):
         """Stop an ongoing run()."""
@@ -1,6 +1,44 @@
 from datetime import datetime
-from typing import Optional, Literal
-import uuid
+from typing import Optional, Literal, Union
+import itertools
+import time
+
+TICK_SIZE = 0.01  # smallest price increment; the book keys levels in ticks
+_TICKS_PER_UNIT = 100  # 1 / TICK_SIZE, kept integral so from_ticks() rounds once
+
+
+def to_ticks(price: float) -> int:
+    """Convert a price to the nearest whole number of ticks.
+
+    Examples:
+        >>> to_ticks(42.5)
+        4250
+    """
+    return round(price * _TICKS_PER_UNIT)
+
+
+def from_ticks(ticks: int) -> float:
+    """Convert a number of ticks back to a price.
+
+    Examples:
+        >>> from_ticks(4250)
+        42.5
+    """
+    return ticks / _TICKS_PER_UNIT
+
+
+# Process-wide order ids: cheap to take, and an int hashes to itself.
+_order_ids = itertools.count(1)
+
+
+def _to_ns(value: Union[datetime, int]) -> int:
+    """Convert a datetime to integer epoch nanoseconds, exact to the microsecond.
+
+    An int is taken to be epoch nanoseconds already and passed through.
+    """
+    if isinstance(value, int):
+        return value
+    return round(value.timestamp() * 1_000_000) * 1_000
 
 
 class Order:
@@ -11,9 +49,13 @@ class Order:
         symbol (str): Stock ticker (e.g. "AAPL").
         order_type (Literal["buy", "sell"]): Direction of the order.
         quantity (int): Number of shares; must be > 0.
-        limit_price (Optional[float]): Limit price; None for market orders.
+        limit_price (Optional[float]): Limit price rounded to TICK_SIZE; None for market orders.
+        limit_ticks (Optional[int]): limit_price as an integer number of ticks.
         order_id (Optional[int]): Unique ID, auto-generated if omitted.
-        timestamp (datetime): Creation time of the order.
+        created_at (int): Creation time of the order as epoch nanoseconds.
+        timestamp (datetime): Creation time of the order, built from created_at on access.
+        symbol_id (Optional[int]): Index of the symbol's book, cached by the Exchange.
+        cancelled (bool): True once the order has been cancelled out of its book.
 
     Examples:
         >>> o = Order(
@@ -25,6 +67,19 @@ class Order:
         ... )
     """
 
+    __slots__ = (
+        "trader_id",
+        "symbol",
+        "order_type",
+        "quantity",
+        "limit_price",
+        "limit_ticks",
+        "order_id",
+        "created_at",
+        "symbol_id",
+        "cancelled",
+    )
+
     def __init__(
         self,
         trader_id: int,
@@ -34,7 +89,8 @@ class Order:
         limit_price: Optional[float] = None,
         *,
         order_id: Optional[int] = None,
-        timestamp: Optional[datetime] = None,
+        timestamp: Optional[Union[datetime, int]] = None,
+        symbol_id: Optional[int] = None,
     ):
         """Initialize a new Order.
 
@@ -45,10 +101,14 @@ class Order:
             quantity (int): >0 shares to trade.
             limit_price (Optional[float]): Limit price; None for market orders.
             order_id (Optional[int]): Unique ID, auto-generated if None.
-            timestamp (Optional[datetime]): Creation time, auto-set if None.
+            timestamp (Optional[Union[datetime, int]]): Creation time as a datetime
+                or as integer epoch nanoseconds; auto-set if None.
+            symbol_id (Optional[int]): Exchange.symbol_ids entry for symbol, if
+                already known; otherwise the Exchange resolves it on arrival.
 
         Raises:
-            ValueError: If quantity <= 0 or order_type invalid.
+            ValueError: If quantity <= 0, limit_price rounds to less than one
+                tick, or order_type invalid.
 
         Examples:
         >>> o = Order(
@@ -73,15 +133,44 @@ class Order:
         if order_type not in ["buy", "sell"]:
             raise ValueError("Invalid order type. Must be of type: 'buy' or 'sell'.")
 
+        # Prices are compared and bucketed as integer ticks from here on.
+        limit_ticks = to_ticks(limit_price) if limit_price is not None else None
+
+        if limit_ticks == 0:
+            raise ValueError(
+                f"Order limit_price must be at least {TICK_SIZE}. Current limit price: {limit_price}"
+            )
+
         self.trader_id = trader_id
         self.symbol = symbol
         self.order_type = order_type
         self.quantity = quantity
-        self.limit_price = limit_price
-        self.order_id = order_id or str(uuid.uuid4())  # or auto-generated
-        self.timestamp = timestamp or datetime.now()
+        self.limit_ticks = limit_ticks
+        self.limit_price = from_ticks(limit_ticks) if limit_ticks is not None else None
+        self.order_id = order_id if order_id is not None else next(_order_ids)
+        # Raw epoch nanoseconds are cheap to take and compare; the datetime view is
+        # only materialised when something reads `timestamp` (e.g. display).
+        self.created_at: int = (
+            _to_ns(timestamp) if timestamp is not None else time.time_ns()
+        )
+
+        self.symbol_id = symbol_id  # Book index from the Exchange
+        self.cancelled = False
+
+    @property
+    def timestamp(self) -> datetime:
+        """Return the creation time of the order as a datetime.
 
-        self.sequence: Optional[int] = None  # Serialization number for OrderBook
+        Examples:
+            >>> o = Order(1, "MTKO", "buy", 2, 999.0, timestamp=datetime(2025, 1, 1))
+            >>> o.timestamp
+            datetime.datetime(2025, 1, 1, 0, 0)
+        """
+        return datetime.fromtimestamp(self.created_at / 1e9)
+
+    @timestamp.setter
+    def timestamp(self, value: Union[datetime, int]) -> None:
+        self.created_at = _to_ns(value)
 
     def __eq__(self, other: "Order") -> bool:
         """Compare orders by order_id for equality.
@@ -89,57 +178,13 @@ class Order:
         Returns:
         (bool): True if two orders have the same order_id, False otherwise.
         """
-        if isinstance(other, Order) == False:
+        if self is other:
+            return True
+
+        if type(other) is not Order:
             return False
 
         return self.order_id == other.order_id
 
     def __hash__(self):
         return hash(self.order_id)
-
-    def __lt__(self, other: "Order") -> bool:
-        """Define ordering for heap operations: price priority then FIFO sequence.
-
-        Args:
-            other (Order): Another Order to compare against.
-
-        Returns:
-            bool: True if self has higher priority than other (i.e., “comes out first” in a min-heap).
-
-        Raises:
-            TypeError: If `other` is not an Order.
-            ValueError: If `self.order_type` and `other.order_type` differ.
-        """
-
-        if not isinstance(other, Order):
-            raise TypeError(f"Cannot compare Order with {type(other).__name__}")
-
-        if self.order_type not in ("buy", "sell") or other.order_type not in (
-            "buy",
-            "sell",
-        ):
-            raise ValueError("order_type must be 'buy' or 'sell'")
-
-        if self.order_type != other.order_type:
-            raise ValueError(
-                f"Cannot compare {self.order_type!r} order with {other.order_type!r} order"
-            )
-
-        if self.order_type == "buy":
-            # Higher price ⇒ “less” so it pops first in the min-heap
-            if self.limit_price != other.limit_price:
-                return self.limit_price > other.limit_price
-
-            if self.timestamp != other.timestamp:
-                return self.timestamp < other.timestamp
-
-            return self.sequence < other.sequence
-
-        # Lower price ⇒ “less” so it pops first
-        if self.limit_price != other.limit_price:
-            return self.limit_price < other.limit_price
-
-        if self.timestamp != other.timestamp:
-            return self.timestamp < other.timestamp
-
-        return self.sequence < other.sequence
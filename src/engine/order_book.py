@@ -1,19 +1,46 @@
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 import heapq
+import math
 
 
-from .order import Order
+from .order import Order, from_ticks
+from .price_level import PriceLevel
+
+FREE_LEVELS_SIZE = 64  # emptied price levels kept per book for reuse
+HEAP_SLACK = 2  # rebuild a price heap once it holds this many entries per open level
+
+
+class RestingCount:
+    """A running count of resting orders that several books can share.
+
+    An Exchange hands one to each of its books so its pending_count is a single
+    attribute read, whichever path (add, fill, pop or cancel) changed a book.
+
+    Attributes:
+        value (int): Orders currently resting in the books that share it.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0
 
 
 class OrderBook:
-    """Maintain separate buy and sell priority queues of orders.
+    """Maintain buy and sell orders grouped into FIFO price levels.
 
-    The book ensures that matching always pulls the highest bid and lowest ask first.
+    Each side maps a limit price, in integer ticks, to a PriceLevel holding its
+    resting orders in time priority and their total volume. A heap of the
+    distinct prices on each side yields the best level directly, so matching
+    always pulls the highest bid and lowest ask first without comparing
+    individual orders.
 
     Attributes:
-        buy_heap (List[Order]): A max-heap that prioritizes pending buy orders.
-        sell_heap (List[Order]): A min-heap that prioritizes pending sell orders.
-        global_seq (int): OrderBook-wide counter of the next order sequence.
+        best_bid (Optional[float]): Cached highest bid price, None if no bids.
+        best_ask (Optional[float]): Cached lowest ask price, None if no asks.
+        best_bid_ticks (Union[int, float]): Highest bid in ticks, -inf if no bids.
+        best_ask_ticks (Union[int, float]): Lowest ask in ticks, +inf if no asks.
+        dirty (bool): True if orders arrived since the book was last matched.
 
     Examples:
     >>> from engine.order_book import OrderBook
@@ -31,21 +58,50 @@ class OrderBook:
     1
     """
 
-    def __init__(self):
-        self._buy_heap: List[Order] = []
-        self._sell_heap: List[Order] = []
-        self._heap_map = {"buy": self._buy_heap, "sell": self._sell_heap}
-        self._global_seq = 0
+    def __init__(self, resting: Optional[RestingCount] = None):
+        """Create an empty book.
+
+        Args:
+            resting (Optional[RestingCount]): Count to keep in step with this
+                book's resting orders, shared with other books; a private one
+                is used if None.
+        """
+        self._resting = resting if resting is not None else RestingCount()
+        self._bids: Dict[int, PriceLevel] = {}
+        self._asks: Dict[int, PriceLevel] = {}
+        # Heaps of the distinct tick prices on each side; bids are negated so the
+        # highest bid sits at the root. Prices of emptied levels are dropped lazily
+        # at the root, and the heap is rebuilt once they outnumber the open levels.
+        self._bid_prices: List[int] = []
+        self._ask_prices: List[int] = []
+        self._orders: Dict[int, Order] = {}
+        # Levels open and close constantly as the touch moves; recycle them
+        # rather than allocating a PriceLevel and deque for every new price.
+        self._free_levels: List[PriceLevel] = []
+        # Top-of-book (in ticks) and size caches, refreshed only when a level
+        # opens or closes. Empty sides hold infinite sentinels, so the book is
+        # crossed exactly when best_bid_ticks >= best_ask_ticks.
+        self.best_bid_ticks: Union[int, float] = -math.inf
+        self.best_ask_ticks: Union[int, float] = math.inf
+        # The levels at those prices, so the head of the book is one load away.
+        self._best_bid_level: Optional[PriceLevel] = None
+        self._best_ask_level: Optional[PriceLevel] = None
+        self._buy_count = 0
+        self._sell_count = 0
+        # Only new arrivals can cross the book, so matching skips clean books.
+        self.dirty = False
 
     def add_order(self, order: Order) -> None:
         """
-        Enqueue an Order into the appropriate heap.
+        Enqueue an Order at the back of its price level, opening the level if needed.
 
         Args:
             order (Order): The order to add.
 
         Raises:
-            ValueError: if order.order_type is not 'buy' or 'sell'.
+            ValueError: if order.order_type is not 'buy' or 'sell', the order
+                has no limit price (a market order cannot rest in the book), or
+                an order with the same order_id is already resting.
 
         Examples:
         >>> from engine.order import Order
@@ -57,14 +113,138 @@ class OrderBook:
         True
         """
 
-        if order.order_type not in self._heap_map:
+        side = order.order_type
+        price = order.limit_ticks
+        if price is None:
+            raise ValueError(f"Order {order.order_id} has no limit price")
+        if order.order_id in self._orders:
+            raise ValueError(f"Order {order.order_id} is already resting")
+
+        # Two sides only: branch on the type directly rather than hashing it
+        # into a side table.
+        if side == "buy":
+            level = self._bids.get(price)
+            if level is None:
+                level = self._bids[price] = self._new_level(order.limit_price)
+                heapq.heappush(self._bid_prices, -price)
+                if price > self.best_bid_ticks:
+                    self.best_bid_ticks = price
+                    self._best_bid_level = level
+            self._buy_count += 1
+        elif side == "sell":
+            level = self._asks.get(price)
+            if level is None:
+                level = self._asks[price] = self._new_level(order.limit_price)
+                heapq.heappush(self._ask_prices, price)
+                if price < self.best_ask_ticks:
+                    self.best_ask_ticks = price
+                    self._best_ask_level = level
+            self._sell_count += 1
+        else:
             raise ValueError(f"Unknown order type: {order.order_type}")
 
-        self._serialize(order)
+        level.append(order)
+        self._orders[order.order_id] = order
+        self._resting.value += 1
+        self.dirty = True
+
+    def add_orders(self, orders: Iterable[Order]) -> None:
+        """Enqueue many orders at once, e.g. when loading a saved book.
+
+        New level prices are appended unsorted and each side's price heap is
+        rebuilt once with heapify (O(n)) instead of sifting per new level.
+
+        Args:
+            orders (Iterable[Order]): The orders to add, in arrival order.
+
+        Raises:
+            ValueError: if an order_type is not 'buy' or 'sell', an order has
+                no limit price, or its order_id is already resting. Orders
+                before it remain in the book.
+
+        Examples:
+        >>> from engine.order import Order
+        >>> from engine.order_book import OrderBook
+        >>> ob = OrderBook()
+        >>> ob.add_orders(
+        ...     Order(trader_id=1, symbol="AAPL", order_type="buy", quantity=1, limit_price=p)
+        ...     for p in (50.0, 52.0, 51.0)
+        ... )
+        >>> ob.best_bid, ob.buy_size()
+        (52.0, 3)
+        """
+        bids, asks = self._bids, self._asks
+        bid_prices, ask_prices = self._bid_prices, self._ask_prices
+        index = self._orders
+        resting = self._resting
+
+        try:
+            for order in orders:
+                side = order.order_type
+                price = order.limit_ticks
+                if price is None:
+                    raise ValueError(f"Order {order.order_id} has no limit price")
+                if order.order_id in index:
+                    raise ValueError(f"Order {order.order_id} is already resting")
+
+                if side == "buy":
+                    level = bids.get(price)
+                    if level is None:
+                        level = bids[price] = self._new_level(order.limit_price)
+                        bid_prices.append(-price)
+                    self._buy_count += 1
+                elif side == "sell":
+                    level = asks.get(price)
+                    if level is None:
+                        level = asks[price] = self._new_level(order.limit_price)
+                        ask_prices.append(price)
+                    self._sell_count += 1
+                else:
+                    raise ValueError(f"Unknown order type: {order.order_type}")
+
+                level.append(order)
+                index[order.order_id] = order
+                resting.value += 1
+                self.dirty = True
+        finally:
+            heapq.heapify(bid_prices)
+            heapq.heapify(ask_prices)
+            self.best_bid_ticks = self._next_best_bid()
+            self._best_bid_level = bids.get(self.best_bid_ticks)
+            self.best_ask_ticks = self._next_best_ask()
+            self._best_ask_level = asks.get(self.best_ask_ticks)
+
+    @property
+    def best_bid(self) -> Optional[float]:
+        """Return the highest bid price, or None if there are no buy orders.
+
+        Examples:
+        >>> from engine.order import Order
+        >>> from engine.order_book import OrderBook
+        >>> ob = OrderBook()
+        >>> ob.best_bid is None
+        True
+        >>> ob.add_order(Order(trader_id=1, symbol="AAPL", order_type="buy", quantity=1, limit_price=50.0))
+        >>> ob.add_order(Order(trader_id=1, symbol="AAPL", order_type="buy", quantity=1, limit_price=55.0))
+        >>> ob.best_bid
+        55.0
+        """
+        return None if self._best_bid_level is None else from_ticks(self.best_bid_ticks)
 
-        heap = self._heap_map[order.order_type]
+    @property
+    def best_ask(self) -> Optional[float]:
+        """Return the lowest ask price, or None if there are no sell orders.
 
-        heapq.heappush(heap, order)
+        Examples:
+        >>> from engine.order import Order
+        >>> from engine.order_book import OrderBook
+        >>> ob = OrderBook()
+        >>> ob.add_order(Order(trader_id=1, symbol="AAPL", order_type="sell", quantity=1, limit_price=50.0))
+        >>> ob.add_order(Order(trader_id=1, symbol="AAPL", order_type="sell", quantity=1, limit_price=55.0))
+        >>> ob.best_ask
+        50.0
+        """
+        return None if self._best_ask_level is None else from_ticks(self.best_ask_ticks)
 
     def peek_best_buy(self) -> Optional[Order]:
         """Return the highest-price sell order without removing it.
@@ -81,9 +261,10 @@ class OrderBook:
         >>> ob.peek_best_buy() == o
         True
         """
-        if not self._buy_heap:
+        level = self._best_bid_level
+        if level is None:
             return None
-        return self._buy_heap[0]
+        return level.peek()
 
     def peek_best_sell(self) -> Optional[Order]:
         """Return the lowest-price sell order without removing it.
@@ -100,9 +281,10 @@ class OrderBook:
         >>> ob.peek_best_sell() == o
         True
         """
-        if not self._sell_heap:
+        level = self._best_ask_level
+        if level is None:
             return None
-        return self._sell_heap[0]
+        return level.peek()
 
     def pop_best_buy(self) -> Optional[Order]:
         """
@@ -122,9 +304,11 @@ class OrderBook:
         >>> ob.buy_size() == 0
         True
         """
-        if not self._buy_heap:
+        if self._best_bid_level is None:
             return None
-        return heapq.heappop(self._buy_heap)
+        order = self._best_bid_level.peek()
+        self._remove(order)
+        return order
 
     def pop_best_sell(self) -> Optional[Order]:
         """Remove and return the lowest-price sell order.
@@ -143,22 +327,169 @@ class OrderBook:
         >>> ob.sell_size() == 0
         True
         """
-        if not self._sell_heap:
+        if self._best_ask_level is None:
             return None
-        return heapq.heappop(self._sell_heap)
+        order = self._best_ask_level.peek()
+        self._remove(order)
+        return order
+
+    def fill(self, order: Order, quantity: int) -> None:
+        """Reduce a resting order by an executed quantity, removing it once exhausted.
+
+        Args:
+            order (Order): A resting order in this book.
+            quantity (int): Number of shares executed against the order.
+
+        Examples:
+        >>> from engine.order import Order
+        >>> from engine.order_book import OrderBook
+        >>> ob = OrderBook()
+        >>> o = Order(trader_id=1, symbol="AAPL", order_type="sell", quantity=10, limit_price=150.0)
+        >>> ob.add_order(o)
+        >>> ob.fill(o, 4)
+        >>> o.quantity, ob.depth("sell")
+        (6, [(150.0, 6)])
+        >>> ob.fill(o, 6)
+        >>> ob.sell_size()
+        0
+        """
+        levels = self._bids if order.order_type == "buy" else self._asks
+        level = levels[order.limit_ticks]
+
+        order.quantity -= quantity
+        level.volume -= quantity
 
-    def _serialize(self, order: Order) -> None:
-        """Adds a sequence number to Order object
+        if order.quantity == 0:
+            self._remove(order)
+
+    def cancel(self, order_id: int) -> Optional[Order]:
+        """Remove a resting order by its ID in O(1).
+
+        The order is flagged cancelled and left behind in its price level as a
+        tombstone unless it is at the front; see PriceLevel.remove(). Orders
+        removed because they filled are never flagged cancelled.
 
         Args:
-            order (Order): Order to be serialized
+            order_id (int): ID of the order to cancel.
+
+        Returns:
+            The cancelled Order, or None if no such order is resting in the book.
+
+        Examples:
+        >>> from engine.order import Order
+        >>> from engine.order_book import OrderBook
+        >>> ob = OrderBook()
+        >>> o = Order(trader_id=1, symbol="AAPL", order_type="buy", quantity=10, limit_price=150.0)
+        >>> ob.add_order(o)
+        >>> ob.cancel(o.order_id) == o
+        True
+        >>> o.cancelled
+        True
+        >>> ob.cancel(o.order_id) is None
+        True
         """
-        if order.sequence != None:
-            return
+        order = self._orders.get(order_id)
+        if order is None:
+            return None
 
-        order.sequence = self._global_seq
+        self._remove(order)
+        order.cancelled = True
+        return order
 
-        self._global_seq += 1
+    def depth(
+        self, order_type: str, levels: Optional[int] = None
+    ) -> List[Tuple[float, int]]:
+        """Return (price, total volume) for each level of a side, best price first.
+
+        Args:
+            order_type (str): 'buy' for bids or 'sell' for asks.
+            levels (Optional[int]): Only return the best `levels` levels; a
+                partial heap selection instead of sorting every price.
+
+        Examples:
+        >>> from engine.order import Order
+        >>> from engine.order_book import OrderBook
+        >>> ob = OrderBook()
+        >>> ob.add_order(Order(trader_id=1, symbol="AAPL", order_type="buy", quantity=5, limit_price=50.0))
+        >>> ob.add_order(Order(trader_id=2, symbol="AAPL", order_type="buy", quantity=1, limit_price=55.0))
+        >>> ob.add_order(Order(trader_id=3, symbol="AAPL", order_type="buy", quantity=2, limit_price=50.0))
+        >>> ob.depth("buy")
+        [(55.0, 1), (50.0, 7)]
+        >>> ob.depth("buy", levels=1)
+        [(55.0, 1)]
+        """
+        book = self._bids if order_type == "buy" else self._asks
+        if levels is None:
+            prices = sorted(book, reverse=(order_type == "buy"))
+        elif order_type == "buy":
+            prices = heapq.nlargest(levels, book)
+        else:
+            prices = heapq.nsmallest(levels, book)
+        return [(book[price].price, book[price].volume) for price in prices]
+
+    def _next_best_bid(self) -> Union[int, float]:
+        """Return the highest open bid price, discarding stale heap prices."""
+        prices = self._bid_prices
+        while prices:
+            if -prices[0] in self._bids:
+                return -prices[0]
+            heapq.heappop(prices)
+        return -math.inf
+
+    def _next_best_ask(self) -> Union[int, float]:
+        """Return the lowest open ask price, discarding stale heap prices."""
+        prices = self._ask_prices
+        while prices:
+            if prices[0] in self._asks:
+                return prices[0]
+            heapq.heappop(prices)
+        return math.inf
+
+    def _new_level(self, price: float) -> PriceLevel:
+        """Return an empty level for `price`, reusing a released one if possible."""
+        if self._free_levels:
+            level = self._free_levels.pop()
+            level.reset(price)
+            return level
+        return PriceLevel(price)
+
+    def _release_level(self, level: PriceLevel) -> None:
+        """Keep an emptied level for reuse, up to FREE_LEVELS_SIZE of them."""
+        if len(self._free_levels) < FREE_LEVELS_SIZE:
+            self._free_levels.append(level)
+
+    def _remove(self, order: Order) -> None:
+        """Unlink a resting order, closing its level and refreshing the caches."""
+        del self._orders[order.order_id]
+        self._resting.value -= 1
+        price = order.limit_ticks
+
+        if order.order_type == "buy":
+            self._buy_count -= 1
+            level = self._bids[price]
+            level.remove(order)
+            if not level:
+                del self._bids[price]
+                self._release_level(level)
+                if price == self.best_bid_ticks:
+                    self.best_bid_ticks = best = self._next_best_bid()
+                    self._best_bid_level = self._bids.get(best)
+                elif len(self._bid_prices) > HEAP_SLACK * len(self._bids):
+                    self._bid_prices = [-p for p in self._bids]
+                    heapq.heapify(self._bid_prices)
+        else:
+            self._sell_count -= 1
+            level = self._asks[price]
+            level.remove(order)
+            if not level:
+                del self._asks[price]
+                self._release_level(level)
+                if price == self.best_ask_ticks:
+                    self.best_ask_ticks = best = self._next_best_ask()
+                    self._best_ask_level = self._asks.get(best)
+                elif len(self._ask_prices) > HEAP_SLACK * len(self._asks):
+                    self._ask_prices = list(self._asks)
+                    heapq.heapify(self._ask_prices)
 
     def buy_size(self) -> int:
         """Return the number of buy orders currently in the book.
@@ -174,7 +505,7 @@ class OrderBook:
         >>> ob.buy_size()
         1
         """
-        return len(self._buy_heap)
+        return self._buy_count
 
     def sell_size(self) -> int:
         """Return the number of sell orders currently in the book.
@@ -190,7 +521,7 @@ class OrderBook:
         >>> ob.sell_size()
         1
         """
-        return len(self._sell_heap)
+        return self._sell_count
 
     @property
     def total_size(self) -> int:
@@ -207,7 +538,7 @@ class OrderBook:
             >>> ob.total_size
             2
         """
-        return len(self._buy_heap) + len(self._sell_heap)
+        return self._buy_count + self._sell_count
 
     def get_buy_orders(self) -> List[Order]:
         """Return a list of all buy orders in descending priority (highest-price first).
@@ -224,9 +555,11 @@ class OrderBook:
             >>> [o.limit_price for o in buys]
             [55.0, 50.0]
         """
-        heap_copy = list(self._buy_heap)
-
-        return sorted(heap_copy, reverse=False)
+        return [
+            order
+            for price in sorted(self._bids, reverse=True)
+            for order in self._bids[price]
+        ]
 
     def get_sell_orders(self) -> List[Order]:
         """
@@ -244,6 +577,4 @@ class OrderBook:
             >>> [o.limit_price for o in sells]
             [50.0, 55.0]
         """
-        heap_copy = list(self._sell_heap)
-
-        return sorted(heap_copy)
+        return [order for price in sorted(self._asks) for order in self._asks[price]]
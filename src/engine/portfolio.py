@@ -1,3 +1,4 @@
+from itertools import chain
 from typing import Dict
 
 from .trade import Trade
@@ -14,6 +15,8 @@ class Portfolio:
       - apply_trade(trade: Trade) → None
     """
 
+    __slots__ = ("_cash", "_reserved_cash", "_positions", "_reserved_positions")
+
     def __init__(self, starting_balance: float):
         """Create a Portfolio with starting cash and no positions.
 
@@ -48,76 +51,79 @@ class Portfolio:
         """
         return dict(self._positions)
 
-    def apply_trade(self, trade: Trade, trader_id: int) -> None:
-        """Update cash and positions based on a filled trade.
-
-        Args:
-            trade (Trade): Filled trade
+    def held_quantity(self, symbol: str) -> int:
         """
-        price, qty, symbol = trade.price, trade.quantity, trade.symbol
+        Returns the free (unreserved) number of shares held in symbol.
 
-        # Ensure we have keys in _positions / _reserved_positions
-        pos = self._positions.setdefault(
-            symbol,
-            Position(0, price),
-        )
-        reserved_pos = self._reserved_positions.setdefault(symbol, Position(0, price))
-
-        # ===== BUY SIDE =====
-        if trader_id == trade.buy_order.trader_id:
-            # Grab original reservation details
-            original_qty = trade.orig_buy_qty
-            original_price = trade.buy_order.limit_price
-            # Total cash originally set aside:
-            old_reservation = original_qty * original_price
-
-            # Unreserve the cash
-            self._reserved_cash -= old_reservation
-
-            self._cash += old_reservation
+        Reads the position in place instead of copying the positions dictionary.
 
-            # Calculate the actual cost
-            actual_cost = qty * price
+        Examples:
+            >>> p = Portfolio(1000.0)
+            >>> p._positions["AAPL"] = Position(5, 100.0)
+            >>> p.held_quantity("AAPL"), p.held_quantity("MSFT")
+            (5, 0)
+        """
+        pos = self._positions.get(symbol)
+        return pos.qty if pos is not None else 0
 
-            # Deduct the actual cost
-            self._cash -= actual_cost
+    def apply_trade(self, trade: Trade, trader_id: int) -> None:
+        """Update cash and positions based on a filled trade.
 
-            # Refund unused reserved cash
-            refund_amount = old_reservation - actual_cost
-            if refund_amount > 0:
-                self._cash += refund_amount
+        Applies whichever side(s) of the trade `trader_id` is on. The matching
+        engine knows the side already and calls apply_buy/apply_sell directly.
 
-            # Get old values to update the running avg
-            old_qty, old_avg = pos.qty, pos.avg_price
-            # Add the shares in
-            pos.qty += qty
-            # Calculate new avg
-            pos.avg_price = (old_avg * old_qty + qty * price) / pos.qty
+        Args:
+            trade (Trade): Filled trade
+        """
+        if trader_id == trade.buyer_id:
+            self.apply_buy(trade)
 
-            remaining_qty = original_qty - qty
-            # If partially filled, re-reserve the remaining cash
-            if remaining_qty > 0:
-                new_reservation = remaining_qty * original_price
-                self._reserved_cash += new_reservation
-                self._cash -= new_reservation
+        if trader_id == trade.seller_id:
+            self.apply_sell(trade)
 
-        # ===== SELL SIDE =====
-        if trader_id == trade.sell_order.trader_id:
-            # Needed to unreserve the holdings and refund unused ones
-            original_qty = trade.orig_sell_qty
-            remaining_qty = original_qty - qty
+    def apply_buy(self, trade: Trade) -> None:
+        """Settle the buy side of a filled trade: pay for the shares and hold them.
 
-            # Unreserve the shares
-            reserved_pos.qty -= original_qty
+        Args:
+            trade (Trade): Filled trade this portfolio bought in.
+        """
+        price, qty, symbol = trade.price, trade.quantity, trade.symbol
+        notional = qty * price
+
+        pos = self._positions.get(symbol)
+        if pos is None:
+            pos = self._positions[symbol] = Position(0, price)
+
+        # Cash for these shares was reserved at the buy limit; release just
+        # that slice and pay the execution price. Any unfilled remainder
+        # stays reserved as it is.
+        released = qty * trade.buy_order.limit_price
+        self._reserved_cash -= released
+        self._cash += released - notional
+
+        # Get old values to update the running avg
+        old_qty, old_avg = pos.qty, pos.avg_price
+        # Add the shares in
+        new_qty = old_qty + qty
+        pos.qty = new_qty
+        # Calculate new avg
+        pos.avg_price = (old_avg * old_qty + notional) / new_qty
+
+    def apply_sell(self, trade: Trade) -> None:
+        """Settle the sell side of a filled trade: deliver the shares and collect cash.
 
-            proceeds = qty * price
-            self._cash += proceeds
+        Args:
+            trade (Trade): Filled trade this portfolio sold in.
+        """
+        qty, symbol = trade.quantity, trade.symbol
 
-            # If partially filled, re-reserve the remaining shares
-            if remaining_qty > 0:
-                reserved_pos.qty = reserved_pos.qty + remaining_qty
+        reserved_pos = self._reserved_positions.get(symbol)
+        if reserved_pos is None:
+            reserved_pos = self._reserved_positions[symbol] = Position(0, trade.price)
 
-        return
+        # Release only the shares that traded; the remainder stays reserved
+        reserved_pos.qty -= qty
+        self._cash += qty * trade.price
 
     def value(self, market_data: Dict[str, Stock]) -> float:
         """
@@ -128,23 +134,29 @@ class Portfolio:
 
         Returns:
             float: Total value of portfolio.
-        """
-
-        total = self._cash + self._reserved_cash
-
-        # Add value of free positions
-        for symbol, qty in self.positions.items():
-            stock = market_data.get(symbol)
-            price = stock.price if (stock is not None) else 0.0
-            total += qty * price
 
-        # Add value of reserved positions
-        for symbol, qty in self._reserved_positions.items():
-            stock = market_data.get(symbol)
-            price = stock.price if (stock is not None) else 0.0
-            total += qty * price
+        Examples:
+            >>> from engine.stock import Stock
+            >>> p = Portfolio(1000.0)
+            >>> p._positions["AAPL"] = Position(5, 90.0)
+            >>> p._reserved_positions["AAPL"] = Position(2, 90.0)
+            >>> p.value({"AAPL": Stock("AAPL", 100.0)})
+            1700.0
+        """
 
-        return total
+        # Free and reserved shares are valued in one pass over both maps,
+        # reading the live positions rather than a copied dictionary.
+        holdings = chain(self._positions.items(), self._reserved_positions.items())
+        md_get = market_data.get  # one attribute lookup, not one per holding
+        return (
+            self._cash
+            + self._reserved_cash
+            + sum(
+                pos.qty * stock.price
+                for symbol, pos in holdings
+                if (stock := md_get(symbol)) is not None
+            )
+        )
 
     def reserve_assets(self, order: Order) -> None:
         """Reserve required cash or shares for a new buy/sell order."""
@@ -161,16 +173,18 @@ class Portfolio:
             self._reserved_cash += cost_estimate
 
         elif order.order_type == "sell":
-            pos = self._positions.setdefault(sym, Position())
+            pos = self._positions.get(sym)
 
-            held = pos.qty
+            held = pos.qty if pos is not None else 0
 
             if held < qty:
                 raise ValueError("Insufficient shares to place sell order.")
             # Reserve shares
             pos.qty = held - qty
-            reserved_pos = self._reserved_positions.setdefault(sym, Position())
-            reserved_pos.qty = reserved_pos.qty + qty
+            reserved_pos = self._reserved_positions.get(sym)
+            if reserved_pos is None:
+                reserved_pos = self._reserved_positions[sym] = Position()
+            reserved_pos.qty += qty
 
         else:
             raise ValueError(f"Unknown order_type: {order.order_type}")
@@ -0,0 +1,132 @@
+from bisect import insort
+from collections import deque
+from operator import attrgetter
+from typing import Deque, Iterator, Set
+
+from .order import Order
+
+_created_at = attrgetter("created_at")
+
+
+class PriceLevel:
+    """A FIFO queue of resting orders that share the same limit price.
+
+    Attributes:
+        price (float): Limit price shared by every order in the level.
+        orders (Deque[Order]): Resting orders in time priority (earliest first),
+            possibly interleaved with tombstones of removed orders.
+        volume (int): Total quantity of the live orders resting at this price.
+
+    Examples:
+        >>> level = PriceLevel(100.0)
+        >>> level.append(Order(1, "AAPL", "buy", 5, 100.0))
+        >>> level.append(Order(2, "AAPL", "buy", 3, 100.0))
+        >>> len(level), level.volume
+        (2, 8)
+    """
+
+    # Rebuild the queue once tombstones make up more than this share of it.
+    COMPACT_RATIO = 0.25
+
+    def __init__(self, price: float):
+        self.price = price
+        self.orders: Deque[Order] = deque()
+        self.volume = 0
+        # id()s of removed orders still sitting in `orders` as tombstones. Not
+        # order_ids: those are caller-supplied and may be reused after a cancel.
+        self._tombstones: Set[int] = set()
+
+    def reset(self, price: float) -> None:
+        """Empty the level and reuse it for another price.
+
+        Args:
+            price (float): The new limit price of the level.
+        """
+        self.price = price
+        self.orders.clear()
+        self.volume = 0
+        self._tombstones.clear()
+
+    def __len__(self) -> int:
+        return len(self.orders) - len(self._tombstones)
+
+    def __iter__(self) -> Iterator[Order]:
+        tombstones = self._tombstones
+        if not tombstones:
+            return iter(self.orders)
+        return (order for order in self.orders if id(order) not in tombstones)
+
+    def append(self, order: Order) -> None:
+        """Queue an order behind every order with an earlier or equal timestamp.
+
+        Orders normally arrive in time order and are appended in O(1). A
+        back-dated order (e.g. a replayed historical order) is binary-searched
+        into its time-priority slot by created_at, so no Order comparison
+        method is ever called.
+
+        Args:
+            order (Order): The order to queue.
+        """
+        if id(order) in self._tombstones:
+            self._compact()  # the order is back; drop its old tombstone first
+        orders = self.orders
+
+        if orders and order.created_at < orders[-1].created_at:
+            insort(orders, order, key=_created_at)
+        else:
+            orders.append(order)
+
+        self.volume += order.quantity
+
+    def peek(self) -> Order:
+        """Return the live order with time priority without removing it."""
+        if self._tombstones:
+            self._skip_tombstones()
+        return self.orders[0]
+
+    def remove(self, order: Order) -> None:
+        """Remove a specific order from the level.
+
+        The order at the front is dropped immediately. Any other order is left
+        in the queue as a tombstone, which peek() and remove() skip; the queue
+        is compacted once tombstones exceed COMPACT_RATIO of it. The order
+        itself is not modified.
+
+        Args:
+            order (Order): The order to remove; must be resting in this level.
+
+        Examples:
+            >>> level = PriceLevel(100.0)
+            >>> first, second = Order(1, "AAPL", "buy", 5, 100.0), Order(2, "AAPL", "buy", 3, 100.0)
+            >>> level.append(first)
+            >>> level.append(second)
+            >>> level.remove(second)
+            >>> len(level), level.volume, list(level) == [first]
+            (1, 5, True)
+        """
+        self._skip_tombstones()
+        orders = self.orders
+
+        if orders[0] is order:
+            orders.popleft()
+        else:
+            tombstones = self._tombstones
+            tombstones.add(id(order))
+            if len(tombstones) > len(orders) * self.COMPACT_RATIO:
+                self._compact()
+        self.volume -= order.quantity
+
+    def _skip_tombstones(self) -> None:
+        """Drop tombstones sitting at the front of the queue."""
+        orders = self.orders
+        tombstones = self._tombstones
+        while tombstones and orders and id(orders[0]) in tombstones:
+            tombstones.discard(id(orders.popleft()))
+
+    def _compact(self) -> None:
+        """Rebuild the queue without its tombstones."""
+        tombstones = self._tombstones
+        self.orders = deque(
+            order for order in self.orders if id(order) not in tombstones
+        )
+        tombstones.clear()
@@ -1,6 +1,7 @@
+from array import array
 import random
 import math
-from typing import List, Callable
+from typing import Callable
 
 
 class Stock:
@@ -13,7 +14,7 @@ class Stock:
     Attributes:
       symbol (str): Ticker symbol (e.g. "AAPL").
       price (float): Latest market price.
-      history (List[float]): Chronological list of previous prices.
+      history (array): Chronological prices packed as C doubles (typecode 'd').
       tick_model (Callable[["Stock"], float]): Function to simulate price change overtime (uniform stub; GBM in Week 8).
       volatility (float): Price's volatility rate.
 
@@ -23,6 +24,15 @@ class Stock:
       >>> s.update_price(next_price)
     """
 
+    __slots__ = (
+        "symbol",
+        "price",
+        "_volatility",
+        "_half_sigma_sq",
+        "history",
+        "tick_model",
+    )
+
     def __init__(
         self,
         symbol: str,
@@ -36,10 +46,22 @@ class Stock:
         """
         self.symbol = symbol
         self.price = price
-        self.volatility = volatility
-        self.history: List[float] = [price]
+        self.volatility = volatility  # also sets the GBM drift term
+        # Packed doubles: 8 bytes per tick instead of a boxed float per list slot.
+        self.history = array("d", (price,))
         self.tick_model = tick_model or self._uniform_stub
 
+    @property
+    def volatility(self) -> float:
+        """Price's volatility rate (sigma in the GBM model)."""
+        return self._volatility
+
+    @volatility.setter
+    def volatility(self, value: float) -> None:
+        self._volatility = value
+        # Ito correction used by gbm_model on every tick; only changes with sigma
+        self._half_sigma_sq = 0.5 * value * value
+
     def update_price(self, new_price: float) -> None:
         """Update the stock's current price and append it to its history.
 
@@ -77,6 +99,26 @@ class Stock:
 
         return self.tick_model(self)
 
+    def tick(self) -> float:
+        """Advance the price by one step of the tick model and record it.
+
+        Equivalent to ``update_price(simulate_price_tick())``, returning the
+        price, for drivers that tick every stock on each step.
+
+        Returns:
+          float: The new price.
+
+        Examples:
+        >>> s = Stock("MTKO", 100.0, tick_model=lambda stock: stock.price + 1.0)
+        >>> s.tick()
+        101.0
+        >>> list(s.history)
+        [100.0, 101.0]
+        """
+        new_price = self.tick_model(self)
+        self.update_price(new_price)
+        return new_price
+
     @staticmethod
     def _uniform_stub(stock: "Stock") -> float:
         """Compute next price via uniform ±1% random walk.
@@ -120,8 +162,9 @@ class Stock:
         >>> old != new
         True
         """
-        sigma = stock.volatility
         z = random.gauss(0, 1)
-        computed_price = stock.price * math.exp(sigma * z - 0.5 * sigma**2)
+        computed_price = stock.price * math.exp(
+            stock._volatility * z - stock._half_sigma_sq
+        )
 
         return max(0.0, computed_price)
@@ -1,23 +1,58 @@
 from datetime import datetime
-import uuid
+from typing import NamedTuple
+import itertools
+import time
 
 from .order import Order
 
+# Process-wide trade ids, numbered in execution order like Order ids.
+_trade_ids = itertools.count(1)
+
+
+class Fill(NamedTuple):
+    """A compact, immutable record of one trader's side of an executed trade."""
+
+    order_id: int
+    symbol: str
+    order_type: str
+    quantity: int
+    price: float
+
 
 class Trade:
     """
     A record of an executed match between a buy and a sell order.
 
     Attributes:
-      trade_id (str): Unique trade indentifier.
+      trade_id (int): Unique trade identifier, increasing in execution order.
       buy_order (Order): The buy order involved in the trade.
       sell_order (Order): The sell order involved in the trade.
+      buyer_id (int): trader_id of the buy order, copied flat for portfolio updates.
+      seller_id (int): trader_id of the sell order, copied flat for portfolio updates.
       symbol (str): Ticker symbol (e.g. "AAPL").
       quantity (int): Actual number of shares traded.
       price (float): Actual execution price.
-      timestamp (datetime): Creation time of the trade.
+      created_at (int): Creation time of the trade as epoch nanoseconds.
+      timestamp (datetime): Creation time of the trade, built from created_at on access.
+      orig_buy_qty (int): Buy order's quantity before this trade.
+      orig_sell_qty (int): Sell order's quantity before this trade.
     """
 
+    # One Trade per execution on the matching path; no per-instance __dict__.
+    __slots__ = (
+        "trade_id",
+        "buy_order",
+        "sell_order",
+        "buyer_id",
+        "seller_id",
+        "symbol",
+        "quantity",
+        "price",
+        "created_at",
+        "orig_buy_qty",
+        "orig_sell_qty",
+    )
+
     def __init__(
         self,
         buy_order: Order,
@@ -47,12 +82,19 @@ class Trade:
             >>> t.symbol
             'AAPL'
         """
-        self.trade_id = str(uuid.uuid4())  # Generate new unique identifier
+        self.trade_id = next(_trade_ids)
         self.buy_order = buy_order
         self.sell_order = sell_order
+        self.buyer_id = buy_order.trader_id
+        self.seller_id = sell_order.trader_id
         self.symbol = symbol
         self.quantity = quantity
         self.price = price
-        self.timestamp = datetime.now()
+        self.created_at = time.time_ns()  # datetime is only built if read
         self.orig_buy_qty = orig_buy_qty
         self.orig_sell_qty = orig_sell_qty
+
+    @property
+    def timestamp(self) -> datetime:
+        """Return the creation time of the trade as a datetime."""
+        return datetime.fromtimestamp(self.created_at / 1e9)
@@ -1,8 +1,11 @@
-from typing import List, Optional
+from collections import deque
+from typing import Deque, Optional
 from .order import Order
 from .portfolio import Portfolio
-from .trade import Trade
-from .position import Position
+from .trade import Fill, Trade
+
+TRANSACTION_LOG_SIZE = 10_000  # most recent fills kept per trader
+_ORDER_TYPES = frozenset(("buy", "sell"))
 
 
 class Trader:
@@ -13,13 +16,15 @@ class Trader:
     Attributes:
         trader_id (int): A unique trader identifier.
         portfolio (Portfolio): #TODO
-        transaction_log (List[Order]): List of previous transactions.
+        transaction_log (Deque[Fill]): The most recent TRANSACTION_LOG_SIZE fills, oldest first.
 
     Examples:
         >>> t = Trader(trader_id=1, starting_balance=10000.0)
         >>> o = t.place_order("MTKO", "buy", 42, 10.0)
     """
 
+    __slots__ = ("trader_id", "portfolio", "transaction_log")
+
     def __init__(
         self,
         trader_id: int,
@@ -35,10 +40,16 @@ class Trader:
         """
         self.trader_id = trader_id
         self.portfolio = Portfolio(starting_balance)
-        self.transaction_log: List[Order] = []
+        self.transaction_log: Deque[Fill] = deque(maxlen=TRANSACTION_LOG_SIZE)
 
     def place_order(
-        self, symbol: str, order_type: str, quantity: int, price: Optional[float]
+        self,
+        symbol: str,
+        order_type: str,
+        quantity: int,
+        price: Optional[float],
+        *,
+        symbol_id: Optional[int] = None,
     ) -> Order:
         """Create a new Order for this trader.
 
@@ -47,6 +58,7 @@ class Trader:
             order_type (str): "buy" or "sell".
             quantity (int): Shares to trade; must be > 0.
             price (Optional[float]): Limit price, or None for market order.
+            symbol_id (Optional[int]): The symbol's Exchange.symbol_ids entry, if known.
 
         Returns:
             Order: the created order instance.
@@ -70,17 +82,17 @@ class Trader:
         if quantity <= 0:
             raise ValueError(f"quantity must be > 0 (got {quantity})")
 
-        if order_type not in ("buy", "sell"):
+        if order_type not in _ORDER_TYPES:
             raise ValueError(f"order_type must be 'buy' or 'sell' (got {order_type!r})")
 
-        pos = self.portfolio.positions.get(symbol, Position())
-
-        positions_num = pos.qty
+        # Holdings only constrain sells; buys are checked against cash on reserve
+        if order_type == "sell":
+            positions_num = self.portfolio.held_quantity(symbol)
 
-        if order_type == "sell" and positions_num < quantity:
-            raise ValueError(
-                f"Cannot sell quantity greater than the number of stocks owned (got {quantity}, but owns {positions_num})"
-            )
+            if positions_num < quantity:
+                raise ValueError(
+                    f"Cannot sell quantity greater than the number of stocks owned (got {quantity}, but owns {positions_num})"
+                )
 
         o = Order(
             trader_id=self.trader_id,
@@ -88,6 +100,7 @@ class Trader:
             order_type=order_type,
             quantity=quantity,
             limit_price=price,
+            symbol_id=symbol_id,
         )
         self.portfolio.reserve_assets(o)
 
@@ -105,23 +118,45 @@ class Trader:
         >>> from engine.trade import Trade
         >>> # Create a trader with 1000 starting cash
         >>> t1 = Trader(trader_id=1, starting_balance=1000.0)
-        >>> # Create a buy and sell order
-        >>> buy_order = Order(trader_id=1, symbol="AAPL", order_type="buy", quantity=2, limit_price=50.0)
+        >>> # Place a buy order (reserving its cash) against another trader's sell
+        >>> buy_order = t1.place_order("AAPL", "buy", 2, 50.0)
         >>> sell_order = Order(trader_id=2, symbol="AAPL", order_type="sell", quantity=2, limit_price=50.0)
         >>> # Execute a trade of 2 shares at 50.0
         >>> trade = Trade(buy_order, sell_order, "AAPL", 2, 50.0, 2, 2)
         >>> t1.update_portfolio(trade)
         >>> t1.portfolio.cash
         900.0
-        >>> t1.portfolio.positions["AAPL"]
+        >>> t1.portfolio.positions["AAPL"].qty
+        2
+        >>> t1.transaction_log[-1].quantity
         2
         """
-        o = (
-            trade.buy_order
-            if trade.buy_order.trader_id == self.trader_id
-            else trade.sell_order
+        if trade.buyer_id == self.trader_id:
+            self.fill_buy(trade)
+
+        if trade.seller_id == self.trader_id:
+            self.fill_sell(trade)
+
+    def fill_buy(self, trade: Trade) -> None:
+        """Record and settle a trade in which this trader is the buyer.
+
+        Args:
+            trade (Trade): a matched trade whose buy_order belongs to this trader.
+        """
+        o = trade.buy_order
+        self.transaction_log.append(
+            Fill(o.order_id, trade.symbol, "buy", trade.quantity, trade.price)
         )
+        self.portfolio.apply_buy(trade)
 
-        self.transaction_log.append(o)
+    def fill_sell(self, trade: Trade) -> None:
+        """Record and settle a trade in which this trader is the seller.
 
-        return self.portfolio.apply_trade(trade, self.trader_id)
+        Args:
+            trade (Trade): a matched trade whose sell_order belongs to this trader.
+        """
+        o = trade.sell_order
+        self.transaction_log.append(
+            Fill(o.order_id, trade.symbol, "sell", trade.quantity, trade.price)
+        )
+        self.portfolio.apply_sell(trade)
@@ -1,20 +1,117 @@
+import atexit
 import logging
+import logging.handlers
+import queue
+from typing import Optional
 
 LOG_FILE = "trading.log"
 LOG_LEVEL = logging.INFO
 LOG_FORMAT = "%(asctime)s | %(levelname)-5s | %(message)s"
 LOG_NAME = "york_exchange"
+LOG_BUFFER_CAPACITY = 1024  # records held in memory before a batched write
+LOG_QUEUE_SIZE = 10_000  # records waiting for the listener before new ones are dropped
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional[logging.handlers.QueueHandler] = None
+
+
+class _NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that never blocks the caller.
+
+    Records are prepared as by the stock QueueHandler: the message is rendered
+    in the calling thread, so arguments such as orders that change after the
+    log call are logged as they were. If the listener falls LOG_QUEUE_SIZE
+    records behind, new records are counted in `dropped` and discarded rather
+    than stalling the caller.
+
+    Examples:
+        >>> log_queue = queue.Queue()
+        >>> handler = _NonBlockingQueueHandler(log_queue)
+        >>> state = ["open"]
+        >>> handler.emit(logging.makeLogRecord({"msg": "%s", "args": (state,)}))
+        >>> state[0] = "filled"
+        >>> log_queue.get_nowait().getMessage()
+        "['open']"
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
 
 
 def setup_logger(name: str = LOG_NAME) -> logging.Logger:
+    """Attach a non-blocking file logger to `name` and return it.
+
+    Log calls render the message and enqueue the record; a background
+    QueueListener applies LOG_FORMAT and hands it to a MemoryHandler that writes
+    to LOG_FILE in batches (immediately on ERROR). Call sites pass %-style
+    arguments (``logger.info("x=%s", x)``) so nothing is formatted for filtered
+    levels.
+    """
+    global _listener, _queue_handler
+
     logger = logging.getLogger(name)
 
     if not logger.handlers:  # avoid duplicate handlers
         logger.setLevel(LOG_LEVEL)
-        handler = logging.FileHandler(LOG_FILE, encoding="utf-8")
-        handler.setLevel(LOG_LEVEL)
+        file_handler = logging.FileHandler(LOG_FILE, encoding="utf-8")
+        file_handler.setLevel(LOG_LEVEL)
         formatter = logging.Formatter(LOG_FORMAT)
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
+        file_handler.setFormatter(formatter)
+        buffer_handler = logging.handlers.MemoryHandler(
+            LOG_BUFFER_CAPACITY, flushLevel=logging.ERROR, target=file_handler
+        )
+
+        log_queue = queue.Queue(LOG_QUEUE_SIZE)
+        _queue_handler = _NonBlockingQueueHandler(log_queue)
+        logger.addHandler(_queue_handler)
+        _listener = logging.handlers.QueueListener(
+            log_queue, buffer_handler, respect_handler_level=True
+        )
+        _listener.start()
+        atexit.register(stop_logger, name)
+
         logger.propagate = True
     return logger
+
+
+def stop_logger(name: str = LOG_NAME) -> None:
+    """Drain queued records, flush them to LOG_FILE and detach the queue handler.
+
+    If any records were dropped on a full queue, a final WARNING says how many.
+    """
+    global _listener, _queue_handler
+
+    if _listener is None:
+        return
+
+    _listener.stop()
+    # setup_logger registers this again if the logger is set up once more.
+    atexit.unregister(stop_logger)
+
+    if _queue_handler.dropped:
+        record = logging.getLogger(name).makeRecord(
+            name,
+            logging.WARNING,
+            __file__,
+            0,
+            "%d log records dropped: logging queue was full",
+            (_queue_handler.dropped,),
+            None,
+        )
+        for handler in _listener.handlers:
+            handler.handle(record)
+
+    for handler in _listener.handlers:
+        target = handler.target
+        handler.close()  # MemoryHandler.close() flushes to its target first
+        target.close()
+
+    logging.getLogger(name).removeHandler(_queue_handler)
+    _listener = _queue_handler = None
@@ -8,20 +8,25 @@ from cli.cli import CLI
 from engine.order import Order
 
 import argparse
+import sys
 from datetime import timedelta
 from logging_config import setup_logger
 from logging import Logger
+from typing import Dict, List, Optional
 
-# Dummy initial prices for Day 3 CLI setup
-MARKET_DATA = {
-    "AAPL": Stock("AAPL", 150.00),
-    "MSFT": Stock("MSFT", 295.50),
-    "GOOG": Stock("GOOG", 2830.75),
-    "AMZN": Stock("AMZN", 3505.20),
-    "TSLA": Stock("TSLA", 720.25),
-    "NFLX": Stock("NFLX", 505.60),
-    "FB": Stock("FB", 355.45),
-}
+
+def make_market_data() -> Dict[str, Stock]:
+    """Return freshly priced stocks, so every run starts from the same market."""
+    # Dummy initial prices for Day 3 CLI setup
+    return {
+        "AAPL": Stock("AAPL", 150.00),
+        "MSFT": Stock("MSFT", 295.50),
+        "GOOG": Stock("GOOG", 2830.75),
+        "AMZN": Stock("AMZN", 3505.20),
+        "TSLA": Stock("TSLA", 720.25),
+        "NFLX": Stock("NFLX", 505.60),
+        "FB": Stock("FB", 355.45),
+    }
 
 
 def manual_loop(exchange: Exchange, logger: Logger):
@@ -46,20 +51,28 @@ Please log in with your Trader ID before issuing any other commands.
     CLI(exchange, logger).run()
 
 
-def main():
+def _make_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="York Stock Exchange Simulator")
     parser.add_argument(
         "--auto",
         nargs="?",
-        const="-1",
+        type=int,
+        const=-1,
         default=None,
         metavar="N",
         help="run automatically for N steps (omit N for infinite); omit flag for manual",
     )
-    args = parser.parse_args()
+    return parser
+
+
+_PARSER = _make_parser()
+
+
+def main(argv: Optional[List[str]] = None):
+    args = _PARSER.parse_args(argv)
 
     logger = setup_logger()
-    exchange = Exchange(market_data=MARKET_DATA)
+    exchange = Exchange(market_data=make_market_data())
     trader = Trader(trader_id=1, starting_balance=1000000)
     trader2 = Trader(trader_id=42, starting_balance=1000000)
 
@@ -83,13 +96,14 @@ def main():
     logger.info("York Stock Exchange CLI v1.0 starting up")
 
     if args.auto is not None:
-        # args.auto == None means “no limit” (infinite); else run that many steps
-
-        # --auto *was* used (with or without N)
-        if args.auto == "-1":
-            steps = None  # infinite
-        else:
-            steps = int(args.auto)  # the provided number
+        # --auto *was* used (with or without N); None means manual mode
+        steps = None if args.auto == -1 else args.auto  # -1: infinite
+        # Nobody is typing in auto mode; let stdout fill whole blocks instead
+        # of flushing every trade line to the terminal.
+        # stdout may be replaced by an object without reconfigure() (e.g. a
+        # StringIO when embedded or under test); keep its buffering then.
+        if hasattr(sys.stdout, "reconfigure"):
+            sys.stdout.reconfigure(line_buffering=False)
         sim.run(steps)
     else:
         manual_loop(exchange, logger)
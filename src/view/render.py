@@ -1,6 +1,36 @@
+from datetime import datetime
+import functools
+import sys
+
 from engine.exchange import Exchange
 from engine.trader import Trader
 
+# Static parts of the portfolio box, built once at import.
+_BOX_WIDTH = 64
+_INNER_WIDTH = _BOX_WIDTH - 2
+_BOX_TOP = "┌" + "─" * _INNER_WIDTH + "┐"
+_BOX_TITLE = "│" + "PORTFOLIO".center(_INNER_WIDTH) + "│"
+_BOX_SEP = "├" + "─" * _INNER_WIDTH + "┤"
+_BOX_BOTTOM = "└" + "─" * _INNER_WIDTH + "┘"
+
+
+def _box_row(text: str) -> str:
+    """Pad `text` to the inner width of the portfolio box and close the row."""
+    return f"{text:<{_INNER_WIDTH + 1}}│"
+
+
+_BOX_CASH_ROW = f"│ Cash: ${{:<{_INNER_WIDTH + 1 - len('│ Cash: $')}}}│".format
+_BOX_POSITIONS_HEADER = _box_row("│ Positions:")
+_BOX_NO_POSITIONS = _box_row("│    None")
+
+_SIDE_LABELS = {"buy": "Buy", "sell": "Sell"}
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_second(epoch_seconds: int) -> str:
+    """Format a whole epoch second for display, once per distinct second."""
+    return datetime.fromtimestamp(epoch_seconds).strftime("%Y-%m-%d %H:%M:%S")
+
 
 def display_prices(exchange: Exchange):
     """
@@ -16,8 +46,12 @@ def display_prices(exchange: Exchange):
     >>> display_prices(ex)  # doctest: +NORMALIZE_WHITESPACE
     AAPL  | $101.00
     """
-    for stock in exchange.market_data.values():
-        print(f"{stock.symbol:<5} | ${stock.price:.2f}")
+    sys.stdout.write(
+        "".join(
+            f"{stock.symbol:<5} | ${stock.price:.2f}\n"
+            for stock in exchange.market_data.values()
+        )
+    )
 
 
 def display_portfolio(exchange: Exchange, trader: Trader):
@@ -25,50 +59,46 @@ def display_portfolio(exchange: Exchange, trader: Trader):
     Print the trader's cash balance and current positions in a Bloomberg-style box.
 
     Examples:
+        >>> from engine.exchange import Exchange
+        >>> from engine.stock import Stock
         >>> from engine.trader import Trader
         >>> from view.render import display_portfolio
+        >>> ex = Exchange(market_data={"AAPL": Stock("AAPL", 100.0)})
         >>> tr = Trader(trader_id=1, starting_balance=1000.0)
-        >>> display_portfolio(tr)  # doctest: +SKIP
-    ┌──────────────────────────────────────────────────────────────┐
-    │                          PORTFOLIO                           │
-    ├──────────────────────────────────────────────────────────────┤
-    │  Cash: $998800.00                                            │
-    │  Positions:                                                  │
-    │    AAPL: 4 @ $150.72  (avg $150.00, unrealized P/L +$0.88)   │
-    └──────────────────────────────────────────────────────────────┘
+        >>> display_portfolio(ex, tr)  # doctest: +NORMALIZE_WHITESPACE
+        ┌──────────────────────────────────────────────────────────────┐
+        │                          PORTFOLIO                           │
+        ├──────────────────────────────────────────────────────────────┤
+        │ Cash: $1000.0                                                │
+        │ Positions:                                                   │
+        │    None                                                      │
+        └──────────────────────────────────────────────────────────────┘
     """
-    box_width = 64
-    inner_width = box_width - 2
-    top = "┌" + "─" * inner_width + "┐"
-    title = "│" + "PORTFOLIO".center(inner_width) + "│"
-    sep = "├" + "─" * inner_width + "┤"
-    cash_line = f"│ Cash: ${trader.portfolio.cash}".ljust(inner_width + 1) + "│"
-    positions_header = "│ Positions:".ljust(inner_width + 1) + "│"
-
-    print()
-    print(top)
-    print(title)
-    print(sep)
-    print(cash_line)
-    print(positions_header)
-
-    positions = trader.portfolio.positions
+    portfolio = trader.portfolio
+    lines = [
+        "",
+        _BOX_TOP,
+        _BOX_TITLE,
+        _BOX_SEP,
+        _BOX_CASH_ROW(portfolio.cash),
+        _BOX_POSITIONS_HEADER,
+    ]
+
+    positions = portfolio.positions
     if not positions:
-        none_line = f"│    None".ljust(inner_width + 1) + "│"
-        print(none_line)
+        lines.append(_BOX_NO_POSITIONS)
     else:
+        market_data = exchange.market_data
         for symbol, pos in positions.items():
-            line = (
-                f"│    {symbol}: {pos.qty} @ ${pos.avg_price}, unrealized P/L +${trader.portfolio.calculate_unrealized_pl(symbol, exchange.market_data):,.2f}".ljust(
-                    inner_width + 1
+            lines.append(
+                _box_row(
+                    f"│    {symbol}: {pos.qty} @ ${pos.avg_price}, unrealized P/L +${portfolio.calculate_unrealized_pl(symbol, market_data):,.2f}"
                 )
-                + "│"
             )
-            print(line)
 
-    bottom = "└" + "─" * inner_width + "┘"
-    print(bottom)
-    print()
+    lines.append(_BOX_BOTTOM)
+    lines.append("\n")
+    sys.stdout.write("\n".join(lines))
 
 
 def display_pending_orders(exchange: Exchange):
@@ -86,12 +116,15 @@ def display_pending_orders(exchange: Exchange):
         >>> ex.add_order(o)
         >>> display_pending_orders(ex)  # doctest: +SKIP
     """
-    for order_book in exchange.order_books.values():
-        for order in order_book.get_buy_orders() + order_book.get_sell_orders():
-            message = (
-                f"\n[{order.timestamp:%Y-%m-%d %H:%M:%S}] Pending {order.order_type.capitalize()} Order: "
-                f"{order.quantity} share{'s' if order.quantity != 1 else ''} of {order.symbol} "
-                f"@ ${order.limit_price:,.2f}."
-            )
-            print(message)
-    print()
+    # Format the whole book first and write it once: one write per order
+    # turns into one syscall per order on a line-buffered terminal.
+    lines = [
+        f"\n[{_format_second(order.created_at // 1_000_000_000)}] Pending {_SIDE_LABELS[order.order_type]} Order: "
+        f"{order.quantity} share{'s' if order.quantity != 1 else ''} of {order.symbol} "
+        f"@ ${order.limit_price:,.2f}.\n"
+        for order_book in exchange.order_books.values()
+        for side in (order_book.get_buy_orders(), order_book.get_sell_orders())
+        for order in side
+    ]
+    lines.append("\n")
+    sys.stdout.write("".join(lines))
@@ -44,7 +44,7 @@ def test_handle_order_invalid_args_num(sample_market: Exchange, caplog, trader:
     )
 
     assert "BUY command usage error" in caplog.text
-    assert len(sample_market.order_books["AAPL"]._buy_heap) == 0
+    assert sample_market.order_books["AAPL"].buy_size() == 0
 
 
 def test_handle_order_adds_order(sample_market: Exchange, trader: Trader):
@@ -64,7 +64,15 @@ def test_handle_order_adds_order(sample_market: Exchange, trader: Trader):
         args=["AAPL", "42", "100.00"],
     )
 
-    assert len(sample_market.order_books["AAPL"]._buy_heap) == 1
+    assert sample_market.order_books["AAPL"].buy_size() == 1
+
+
+def test_handle_order_uses_exchange_symbol(sample_market: Exchange, trader: Trader):
+    symbol = "".join(["AA", "PL"])  # equal to, but not the same object as, the key
+
+    o = handle_order(sample_market, trader, "buy", [symbol, "1", "100.00"])
+
+    assert o.symbol is sample_market.symbols[o.symbol_id]
 
 
 def test_do_next_updates_prices(sample_market: Exchange):
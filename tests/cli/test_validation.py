@@ -1,16 +1,43 @@
-from cli.validation import validate_symbol, parse_order
+from cli.validation import (
+    ORDER_BAD_ARGS,
+    ORDER_BAD_PRICE,
+    ORDER_BAD_QTY,
+    validate_symbol,
+    parse_order,
+    resolve_symbol,
+)
 
 
 def test_parse_order_valid():
-    sym, q, p = parse_order(["AAPL", "10", "150"])
+    err, parsed = parse_order(["AAPL", "10", "150"])
+    assert err == 0
+    sym, q, p = parsed
     assert sym == "AAPL" and q == 10 and p == 150.0
 
 
 def test_parse_order_invalid_qty_price():
-    sym, q, p = parse_order(["MTKO", "MTKO", "MTKO"])
-    assert sym == "MTKO" and q == None and p == None
+    err, parsed = parse_order(["MTKO", "MTKO", "MTKO"])
+    assert err == ORDER_BAD_QTY | ORDER_BAD_PRICE and parsed is None
 
 
 def test_parse_order_invalid_args_num():
-    sym, q, p = parse_order(["AAPL", "10", "150", "42"])
-    assert sym == None and q == None and p == None
+    err, parsed = parse_order(["AAPL", "10", "150", "42"])
+    assert err == ORDER_BAD_ARGS and parsed is None
+
+
+def test_parse_order_rejects_zero_qty():
+    err, parsed = parse_order(["AAPL", "0", "150"])
+    assert err == ORDER_BAD_QTY and parsed is None
+
+
+def test_parse_order_rejects_sub_tick_price():
+    err, parsed = parse_order(["AAPL", "1", "0.004"])
+    assert err == ORDER_BAD_PRICE and parsed is None
+
+
+def test_resolve_symbol(sample_market):
+    assert (
+        resolve_symbol("MSFT", sample_market, "BUY", [])
+        == sample_market.symbol_ids["MSFT"]
+    )
+    assert resolve_symbol("MTKO", sample_market, "BUY", []) is None
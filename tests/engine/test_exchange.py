@@ -7,3 +7,45 @@ def test_add_order_and_match_stub(sample_market: Exchange, trader: Trader):
     sample_market.add_order(o)
     trades = sample_market.match_orders("AAPL")
     assert trades == []  # still a stub
+
+
+def test_add_order_keeps_arrival_order_within_level(
+    sample_market: Exchange, trader: Trader
+):
+    o1 = trader.place_order("AAPL", "buy", 1, 10.0)
+    o2 = trader.place_order("AAPL", "buy", 1, 10.0)
+    o2.created_at = o1.created_at
+    sample_market.add_order(o1)
+    sample_market.add_order(o2)
+    assert sample_market.order_books["AAPL"].get_buy_orders() == [o1, o2]
+
+
+def test_match_all_skips_clean_books(sample_market: Exchange, trader: Trader):
+    o = trader.place_order("AAPL", "buy", 1, 10.0)
+    sample_market.add_order(o)
+    assert sample_market.order_books["AAPL"].dirty
+    assert not sample_market.order_books["MSFT"].dirty
+
+    assert sample_market.match_all() == []
+    assert not sample_market.order_books["AAPL"].dirty
+
+
+def test_add_order_resolves_symbol_id(sample_market: Exchange, trader: Trader):
+    o = trader.place_order("MSFT", "buy", 1, 10.0)
+    sample_market.add_order(o)
+    assert o.symbol_id == sample_market.symbol_ids["MSFT"]
+    assert sample_market.order_books["MSFT"].peek_best_buy() is o
+
+
+def test_add_order_rejects_mismatched_symbol_id(
+    sample_market: Exchange, trader: Trader
+):
+    for bad_id in (sample_market.symbol_ids["AAPL"], len(sample_market.symbols)):
+        o = trader.place_order("MSFT", "buy", 1, 10.0, symbol_id=bad_id)
+        try:
+            sample_market.add_order(o)
+            assert False
+        except ValueError:
+            pass
+
+    assert sample_market.pending_count == 0
@@ -0,0 +1,25 @@
+from datetime import timedelta
+
+from engine.exchange import Exchange
+from engine.market_simulator import MarketSimulator
+from engine.position import Position
+from engine.trader import Trader
+
+
+def test_step_returns_trades(sample_market: Exchange, trader: Trader, trader2: Trader):
+    trader.portfolio._positions["AAPL"] = Position(qty=5)
+    sample_market.add_order(trader.place_order("AAPL", "sell", 5, 100))
+    sample_market.add_order(trader2.place_order("AAPL", "buy", 5, 100))
+
+    sim = MarketSimulator(sample_market, tick_interval=timedelta(seconds=1))
+    trades = sim.step()
+
+    assert len(trades) == 1
+    assert sim.step() == []
+
+
+def test_run_counts_steps_without_trades(sample_market: Exchange):
+    sim = MarketSimulator(sample_market, tick_interval=timedelta(seconds=1))
+    sim.run(3)
+
+    assert len(sample_market.market_data["AAPL"].history) == 4
@@ -132,3 +132,74 @@ def test_match_price_time(sample_market: Exchange, trader: Trader, trader2: Trad
     assert sample_market.order_books[SYMBOL].buy_size() == 0
     assert sample_market.order_books[SYMBOL].sell_size() == 1
     assert sample_market.order_books[SYMBOL].peek_best_sell() is o3
+
+
+def test_match_updates_pending_count(
+    sample_market: Exchange, trader: Trader, trader2: Trader
+):
+    SYMBOL = "AAPL"
+    trader.portfolio._positions[SYMBOL] = Position(qty=10)
+
+    sample_market.add_order(trader.place_order(SYMBOL, "sell", 10, 100))
+    sample_market.add_order(trader2.place_order(SYMBOL, "buy", 4, 100))
+    msft = trader2.place_order("MSFT", "buy", 1, 100)
+    sample_market.add_order(msft)
+    assert sample_market.pending_count == 3
+
+    sample_market.match_all()
+    assert sample_market.pending_count == 2
+
+    sample_market.order_books["MSFT"].cancel(msft.order_id)
+    assert sample_market.pending_count == 1
+
+
+def test_match_partial_fill_settles_cash(
+    sample_market: Exchange, trader: Trader, trader2: Trader
+):
+    SYMBOL = "AAPL"
+    START = 1_000_000
+    trader.portfolio._positions[SYMBOL] = Position(qty=10)
+
+    sample_market.add_order(trader.place_order(SYMBOL, "sell", 10, 90))
+    sample_market.add_order(trader2.place_order(SYMBOL, "buy", 42, 100))
+    sample_market.match_orders(SYMBOL)
+
+    # Buyer pays 10 @ 90 and keeps the unfilled 32 reserved at the limit
+    assert trader2.portfolio._reserved_cash == 32 * 100
+    assert trader2.portfolio.cash == START - 10 * 90 - 32 * 100
+    assert trader2.portfolio.positions[SYMBOL].qty == 10
+
+    assert trader.portfolio.cash == START + 10 * 90
+    assert trader.portfolio._reserved_positions[SYMBOL].qty == 0
+
+
+def test_match_numbers_trades_in_order(
+    sample_market: Exchange, trader: Trader, trader2: Trader
+):
+    SYMBOL = "AAPL"
+    trader.portfolio._positions[SYMBOL] = Position(qty=2)
+
+    for _ in range(2):
+        sample_market.add_order(trader.place_order(SYMBOL, "sell", 1, 100))
+    sample_market.add_order(trader2.place_order(SYMBOL, "buy", 2, 100))
+
+    first, second = sample_market.match_orders(SYMBOL)
+    assert first.trade_id < second.trade_id
+
+
+def test_match_self_trade_settles_each_side_once(
+    sample_market: Exchange, trader: Trader
+):
+    SYMBOL = "AAPL"
+    START = 1_000_000
+    trader.portfolio._positions[SYMBOL] = Position(qty=10, avg_price=100.0)
+
+    sample_market.add_order(trader.place_order(SYMBOL, "sell", 5, 100))
+    sample_market.add_order(trader.place_order(SYMBOL, "buy", 5, 100))
+    sample_market.match_orders(SYMBOL)
+
+    assert trader.portfolio.cash == START
+    assert trader.portfolio._reserved_cash == 0
+    assert trader.portfolio.positions[SYMBOL].qty == 10
+    assert trader.portfolio._reserved_positions[SYMBOL].qty == 0
+    assert [f.order_type for f in trader.transaction_log] == ["sell", "buy"]
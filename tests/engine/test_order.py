@@ -27,3 +27,20 @@ def test_order_constructor_invalid_order_type():
         assert False
     except ValueError:
         assert True
+
+
+def test_order_limit_price_rounds_to_tick():
+    o = Order(
+        trader_id=1, symbol="AAPL", order_type="buy", quantity=1, limit_price=42.004
+    )
+    assert (o.limit_ticks, o.limit_price) == (4200, 42.0)
+
+
+def test_order_constructor_sub_tick_price():
+    try:
+        _ = Order(
+            trader_id=1, symbol="AAPL", order_type="buy", quantity=1, limit_price=0.001
+        )
+        assert False
+    except ValueError:
+        assert True
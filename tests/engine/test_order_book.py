@@ -1,12 +1,13 @@
 from engine.order_book import OrderBook
 from engine.order import Order
-from datetime import datetime
+from datetime import datetime, timedelta
+import random
 
 
 def test_order_book_empty_pop():
     order_book = OrderBook()
-    assert order_book.pop_best_buy() == None
-    assert order_book.pop_best_sell() == None
+    assert order_book.pop_best_buy() is None
+    assert order_book.pop_best_sell() is None
 
 
 def test_order_book_insert_pop():
@@ -78,3 +79,260 @@ def test_order_book_side_independence():
 
     assert order_book.pop_best_buy() == o2
     assert order_book.pop_best_sell() == o1
+
+
+def test_order_book_level_fifo():
+    ts = datetime(2025, 1, 1, 0, 0)
+    o1 = Order(1, "AAPL", "sell", 1, 42.0, timestamp=ts)
+    o2 = Order(2, "AAPL", "sell", 1, 42.0, timestamp=ts)
+
+    order_book = OrderBook()
+
+    order_book.add_order(o1)
+    order_book.add_order(o2)
+
+    assert order_book.depth("sell") == [(42.0, 2)]
+    assert order_book.pop_best_sell() == o1
+    assert order_book.pop_best_sell() == o2
+    assert order_book.depth("sell") == []
+
+
+def test_order_book_cancel():
+    o1 = Order(1, "AAPL", "buy", 3, 50.0)
+    o2 = Order(2, "AAPL", "buy", 4, 42.0)
+
+    order_book = OrderBook()
+
+    order_book.add_order(o1)
+    order_book.add_order(o2)
+
+    assert order_book.cancel(o1.order_id) == o1
+    assert order_book.cancel(o1.order_id) is None
+    assert order_book.peek_best_buy() == o2
+    assert order_book.depth("buy") == [(42.0, 4)]
+    assert order_book.total_size == 1
+
+
+def test_order_book_best_price_cache():
+    o1 = Order(1, "AAPL", "buy", 1, 50.0)
+    o2 = Order(1, "AAPL", "buy", 1, 55.0)
+    o3 = Order(1, "AAPL", "buy", 1, 45.0)
+
+    order_book = OrderBook()
+
+    for o in (o1, o2, o3):
+        order_book.add_order(o)
+
+    assert order_book.best_bid == 55.0
+    assert order_book.best_ask is None
+
+    order_book.cancel(o1.order_id)
+    assert order_book.best_bid == 55.0
+
+    order_book.pop_best_buy()
+    assert order_book.best_bid == 45.0
+    assert (order_book.buy_size(), order_book.total_size) == (1, 1)
+
+    order_book.pop_best_buy()
+    assert order_book.best_bid is None
+
+
+def test_order_book_rejects_market_order():
+    order_book = OrderBook()
+    try:
+        order_book.add_order(Order(1, "AAPL", "buy", 1))
+        assert False
+    except ValueError:
+        assert order_book.buy_size() == 0
+
+
+def test_order_book_cancel_inside_level():
+    orders = [Order(i, "AAPL", "sell", 1, 50.0) for i in range(8)]
+
+    order_book = OrderBook()
+
+    for o in orders:
+        order_book.add_order(o)
+
+    order_book.cancel(orders[1].order_id)
+    order_book.cancel(orders[0].order_id)
+
+    assert order_book.peek_best_sell() == orders[2]
+    assert order_book.get_sell_orders() == orders[2:]
+    assert order_book.depth("sell") == [(50.0, 6)]
+
+    for o in orders[3:]:
+        order_book.cancel(o.order_id)
+
+    assert order_book.pop_best_sell() == orders[2]
+    assert order_book.best_ask is None
+
+
+def test_order_book_fill_inside_level_is_not_cancelled():
+    orders = [Order(i, "AAPL", "sell", 1, 50.0) for i in range(3)]
+
+    order_book = OrderBook()
+
+    for o in orders:
+        order_book.add_order(o)
+
+    order_book.fill(orders[1], 1)
+    order_book.cancel(orders[2].order_id)
+
+    assert not orders[1].cancelled
+    assert orders[2].cancelled
+    assert order_book.get_sell_orders() == orders[:1]
+
+
+def test_order_book_price_heaps_stay_bounded():
+    order_book = OrderBook()
+    order_book.add_order(Order(1, "AAPL", "buy", 1, 100.0))
+    order_book.add_order(Order(1, "AAPL", "sell", 1, 110.0))
+
+    for _ in range(1_000):
+        bid = Order(1, "AAPL", "buy", 1, 90.0)
+        ask = Order(1, "AAPL", "sell", 1, 120.0)
+        order_book.add_order(bid)
+        order_book.add_order(ask)
+        order_book.cancel(bid.order_id)
+        order_book.cancel(ask.order_id)
+
+    assert len(order_book._bid_prices) <= 2 and len(order_book._ask_prices) <= 2
+    assert (order_book.best_bid, order_book.best_ask) == (100.0, 110.0)
+
+
+def test_order_book_cancel_then_readd_same_id():
+    orders = [Order(i, "AAPL", "buy", 1, 50.0) for i in range(3)]
+
+    order_book = OrderBook()
+
+    for o in orders:
+        order_book.add_order(o)
+
+    order_book.cancel(orders[1].order_id)
+    replacement = Order(9, "AAPL", "buy", 1, 50.0, order_id=orders[1].order_id)
+    order_book.add_order(replacement)
+
+    assert order_book.get_buy_orders() == [orders[0], orders[2], replacement]
+
+    order_book.cancel(replacement.order_id)
+    assert order_book.pop_best_buy() is orders[0]
+    assert order_book.pop_best_buy() is orders[2]
+    assert order_book.pop_best_buy() is None
+
+
+def test_order_book_readd_cancelled_order():
+    orders = [Order(i, "AAPL", "buy", 1, 50.0, timestamp=i) for i in range(3)]
+
+    order_book = OrderBook()
+
+    for o in orders:
+        order_book.add_order(o)
+
+    order_book.cancel(orders[1].order_id)
+    order_book.add_order(orders[1])
+
+    # It keeps its created_at, so it is slotted back into its time priority.
+    assert order_book.get_buy_orders() == orders
+    assert order_book.depth("buy") == [(50.0, 3)]
+
+
+def test_order_book_rejects_duplicate_resting_id():
+    o = Order(1, "AAPL", "buy", 1, 50.0)
+
+    order_book = OrderBook()
+    order_book.add_order(o)
+
+    try:
+        order_book.add_order(Order(1, "AAPL", "sell", 1, 60.0, order_id=o.order_id))
+        assert False
+    except ValueError:
+        assert order_book.sell_size() == 0
+
+
+def test_order_book_reuses_empty_levels():
+    o1 = Order(1, "AAPL", "sell", 2, 50.0)
+    o2 = Order(2, "AAPL", "sell", 1, 51.0)
+
+    order_book = OrderBook()
+
+    order_book.add_order(o1)
+    order_book.cancel(o1.order_id)
+    order_book.add_order(o2)
+
+    assert order_book.peek_best_sell() == o2
+    assert order_book.depth("sell") == [(51.0, 1)]
+
+
+def test_order_book_add_orders_matches_add_order():
+    prices = [50.0, 53.0, 51.0, 53.0, 49.0]
+    bulk = OrderBook()
+    single = OrderBook()
+
+    bulk.add_orders(Order(1, "AAPL", "sell", 1, p) for p in prices)
+    for p in prices:
+        single.add_order(Order(1, "AAPL", "sell", 1, p))
+
+    assert bulk.depth("sell") == single.depth("sell")
+    assert bulk.best_ask == single.best_ask == 49.0
+    assert [o.limit_price for o in iter(bulk.pop_best_sell, None)] == sorted(prices)
+
+
+def test_order_book_depth_top_levels():
+    order_book = OrderBook()
+
+    for p in (50.0, 53.0, 51.0, 49.0):
+        order_book.add_order(Order(1, "AAPL", "sell", 1, p))
+        order_book.add_order(Order(1, "AAPL", "buy", 1, p - 10))
+
+    assert order_book.depth("sell", levels=2) == [(49.0, 1), (50.0, 1)]
+    assert order_book.depth("buy", levels=2) == [(43.0, 1), (41.0, 1)]
+    assert order_book.depth("sell", levels=10) == order_book.depth("sell")
+
+
+def test_order_book_price_time_priority_randomized():
+    rng = random.Random(20250101)  # fixed seed: same 50 books on every run
+    base = datetime(2025, 1, 1)
+
+    for _ in range(50):
+        for side, sign in (("buy", -1), ("sell", 1)):
+            orders = [
+                Order(
+                    1,
+                    "AAPL",
+                    side,
+                    1,
+                    rng.randint(1, 20) / 2,
+                    timestamp=base + timedelta(seconds=rng.randint(0, 5)),
+                )
+                for _ in range(rng.randint(1, 32))
+            ]
+            order_book = OrderBook()
+            for o in orders:
+                order_book.add_order(o)
+
+            # best price first, then earliest timestamp, then arrival order
+            expected = [
+                o
+                for _, o in sorted(
+                    enumerate(orders),
+                    key=lambda io: (sign * io[1].limit_ticks, io[1].created_at, io[0]),
+                )
+            ]
+            pop = order_book.pop_best_buy if side == "buy" else order_book.pop_best_sell
+            assert [pop() for _ in orders] == expected
+            assert pop() is None
+
+
+def test_order_book_priority_with_ns_timestamps():
+    o1 = Order(1, "AAPL", "buy", 1, 42.0, timestamp=2)
+    o2 = Order(1, "AAPL", "buy", 1, 42.0, timestamp=1)
+
+    order_book = OrderBook()
+
+    order_book.add_order(o1)
+    order_book.add_order(o2)
+
+    assert o2.created_at == 1
+    assert order_book.pop_best_buy() == o2
+    assert order_book.pop_best_buy() == o1
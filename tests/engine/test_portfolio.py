@@ -14,7 +14,7 @@ def test_portfolio_value_pure_cash(trader: Trader, sample_market: Exchange):
 def test_portfolio_value_combined(trader: Trader, sample_market: Exchange):
     SHARE_NUM = 50
 
-    trader.portfolio._positions["AAPL"] = SHARE_NUM
+    trader.portfolio._positions["AAPL"] = Position(SHARE_NUM, 100.0)
     assert trader.portfolio.value(sample_market.market_data) == (
         trader.portfolio.cash + trader.portfolio._reserved_cash
     ) + (sample_market.market_data["AAPL"].price * SHARE_NUM)
@@ -50,3 +50,21 @@ def test_portfolio_reserve_assets_sell(trader: Trader):
     trader.portfolio.reserve_assets(o)
 
     assert trader.portfolio.positions[TICKET].qty == old_qty - ORDER_QTY
+
+
+def test_portfolio_held_quantity(trader: Trader):
+    trader.portfolio._positions["AAPL"] = Position(7, 100.0)
+
+    assert trader.portfolio.held_quantity("AAPL") == 7
+    assert trader.portfolio.held_quantity("MSFT") == 0
+    assert "MSFT" not in trader.portfolio.positions
+
+
+def test_portfolio_reserve_assets_sell_unheld(trader: Trader):
+    o = Order(trader.trader_id, "AAPL", "sell", 1, 100.0)
+
+    try:
+        trader.portfolio.reserve_assets(o)
+        assert False
+    except ValueError:
+        assert "AAPL" not in trader.portfolio.positions
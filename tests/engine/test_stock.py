@@ -14,3 +14,30 @@ def test_tick_updates_value():
     s.update_price(50.0)
 
     assert s.price == 50.0
+
+
+def test_update_price_appends_history():
+    s = Stock("MTKO", 42.0)
+    s.update_price(50.0)
+    s.update_price(45.5)
+
+    assert list(s.history) == [42.0, 50.0, 45.5]
+
+
+def test_tick_updates_price_and_history():
+    s = Stock("MTKO", 42.0, tick_model=lambda stock: stock.price * 2)
+    new = s.tick()
+
+    assert new == s.price == 84.0
+    assert list(s.history) == [42.0, 84.0]
+
+
+def test_gbm_model_tracks_volatility_changes(monkeypatch):
+    import math
+    import random
+
+    monkeypatch.setattr(random, "gauss", lambda mu, sigma: 1.0)
+    s = Stock("MTKO", 100.0, volatility=0.2, tick_model=Stock.gbm_model)
+    s.volatility = 0.1
+
+    assert s.tick() == 100.0 * math.exp(0.1 - 0.5 * 0.1**2)
@@ -1,5 +1,6 @@
-from engine.trader import Trader
+from engine.trader import Trader, TRANSACTION_LOG_SIZE
 from engine.order import Order
+from engine.trade import Trade
 
 
 def test_place_order_returns_order(trader: Trader):
@@ -9,3 +10,16 @@ def test_place_order_returns_order(trader: Trader):
     assert o.order_type == "buy"
     assert o.quantity == 42
     assert o.limit_price == 100.0
+
+
+def test_update_portfolio_records_fill(trader: Trader):
+    buy = trader.place_order("AAPL", "buy", 3, 100.0)
+    sell = Order(
+        trader_id=2, symbol="AAPL", order_type="sell", quantity=3, limit_price=90.0
+    )
+
+    trader.update_portfolio(Trade(buy, sell, "AAPL", 3, 90.0, 3, 3))
+
+    fill = trader.transaction_log[-1]
+    assert fill == (buy.order_id, "AAPL", "buy", 3, 90.0)
+    assert trader.transaction_log.maxlen == TRANSACTION_LOG_SIZE
@@ -1,28 +1,28 @@
-import subprocess
-import sys
-import os
-
-CLI_LOOP_PATH = os.path.abspath(
-    os.path.join(os.path.dirname(__file__), "..", "src", "main.py")
-)
-
-
-def run_cli(commands: str, tmp_path):
-    """Helper: run main.py with a sequence of newline-separated commands."""
-    proc = subprocess.run(
-        [sys.executable, CLI_LOOP_PATH],
-        input=commands,
-        text=True,
-        capture_output=True,
-        timeout=5.00,
-        cwd=str(tmp_path),
-    )
+import io
+
+import pytest
+
+from logging_config import stop_logger
+from main import main
+
+
+def run_cli(commands: str, tmp_path, monkeypatch, capsys):
+    """Helper: run the CLI in-process with a sequence of newline-separated commands."""
+    monkeypatch.chdir(tmp_path)  # trading.log is opened relative to the cwd
+    monkeypatch.setattr("sys.stdin", io.StringIO(commands))
+
+    try:
+        main([])
+    except Exception as exc:
+        # Report the command output seen so far along with the exception.
+        pytest.fail(f"CLI raised {exc!r}; output:\n{capsys.readouterr().out}")
+    finally:
+        stop_logger()  # no-op after "quit"; detaches the file logger otherwise
 
-    assert proc.returncode == 0, f"CLI crashed: {proc.stderr!r}"
-    return proc.stdout
+    return capsys.readouterr().out
 
 
-def test_smoke_flow(tmp_path):
+def test_smoke_flow(tmp_path, monkeypatch, capsys):
     cmds = (
         "\n".join(
             [
@@ -37,7 +37,7 @@ def test_smoke_flow(tmp_path):
         )
         + "\n"
     )
-    output = run_cli(cmds, tmp_path)
+    output = run_cli(cmds, tmp_path, monkeypatch, capsys)
 
     # Basic CLI output checks
     assert "AAPL" in output